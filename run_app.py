@@ -52,8 +52,13 @@ def main():
         print("="*70 + "\n")
         
         from inclusive_job_ad_analyser.webapp import create_interface
-        
-        interface = create_interface()
+
+        try:
+            interface = create_interface()
+        except ImportError:
+            print("Error: Gradio is not installed.", file=sys.stderr)
+            print("Install it with: pip install gradio", file=sys.stderr)
+            sys.exit(1)
         interface.launch(
             server_name="127.0.0.1",
             server_port=args.port,
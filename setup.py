@@ -24,13 +24,22 @@ setup(
     package_dir={"": "src"},
     python_requires=">=3.10",
     install_requires=[
+        "numpy>=1.26.0,<3.0.0",
         "pandas>=2.0.0,<3.0.0",
         "PyYAML>=6.0,<7.0",
         "colorama>=0.4.6,<1.0.0",
+        "pyahocorasick>=2.0.0,<3.0.0",
         "spacy>=3.7.0,<4.0.0",
     ],
     extras_require={
         "web": ["gradio>=4.0.0,<5.0.0"],
+        "scraping": [
+            "requests>=2.31.0,<3.0.0",
+            "beautifulsoup4>=4.12.0,<5.0.0",
+            "lxml>=5.0.0,<6.0.0",
+            "httpx>=0.27.0,<1.0.0",
+        ],
+        "perf": ["orjson>=3.9.0,<4.0.0"],
         "dev": [
             "pytest>=7.4.0,<8.0.0",
             "pytest-cov>=4.1.0,<5.0.0",
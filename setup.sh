@@ -48,16 +48,6 @@ pip install -r requirements.txt --quiet
 echo "✓ Dependencies installed"
 echo ""
 
-# Download spaCy model
-echo "Downloading spaCy model..."
-if python -c "import spacy; spacy.load('en_core_web_sm')" 2>/dev/null; then
-    echo "✓ spaCy model already installed"
-else
-    python -m spacy download en_core_web_sm
-    echo "✓ spaCy model downloaded"
-fi
-echo ""
-
 # Run tests
 echo "Running tests..."
 if pytest -q; then
@@ -2,19 +2,86 @@
 Core bias detection analysis engine.
 """
 
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Tuple
+import pickle
 import re
+import threading
+from functools import lru_cache
+from bisect import bisect_right
+from collections import Counter, OrderedDict, defaultdict
+from hashlib import blake2b
 from pathlib import Path
 
 from .models import FlaggedTerm, MatchResult
 from .loaders import BiasTermsLoader
 
+@lru_cache(maxsize=None)
+def _load_sentencizer():
+    """
+    Build the sentencizer-only spaCy pipeline, or None if spaCy is missing.
+
+    Imported lazily so `import inclusive_job_ad_analyser` (and every
+    --no-spacy CLI run) doesn't pay spaCy's import cost up front. The
+    pipeline is a process-wide singleton: it is stateless between calls,
+    so every analyser instance shares one copy instead of rebuilding the
+    vocab per construction.
+    """
+    try:
+        import spacy
+    except ImportError:
+        return None
+
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    return nlp
+
+
+# Fallback sentence-boundary pattern, compiled once at import time
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Used to classify exception phrases and tokenize contexts for the
+# whole-word exception fast path
+_SINGLE_WORD_RE = re.compile(r'\w+')
+_NON_WORD_RE = re.compile(r'\W+')
+
 try:
-    import spacy
-    from spacy.language import Language
-    _HAS_SPACY = True
+    import ahocorasick
+    _HAS_AHOCORASICK = True
 except ImportError:
-    _HAS_SPACY = False
+    _HAS_AHOCORASICK = False
+
+# On-disk cache of built automatons, keyed by the term dictionary, so
+# repeat CLI invocations skip automaton construction entirely.
+_AUTOMATON_CACHE_DIR = (
+    Path.home() / '.cache' / 'inclusive-job-ad-analyser' / 'automata'
+)
+
+
+def _automaton_cache_path(term_keys) -> Path:
+    """Return the cache file path for a given set of term keys."""
+    digest = blake2b(
+        '\n'.join(sorted(term_keys)).encode('utf-8'), digest_size=16
+    ).hexdigest()
+    return _AUTOMATON_CACHE_DIR / f'ac-{digest}.pkl'
+
+
+def _load_cached_automaton(path: Path) -> Optional['ahocorasick.Automaton']:
+    """Load a previously saved automaton, or None if absent or unreadable."""
+    try:
+        return ahocorasick.load(str(path), pickle.loads)
+    except (OSError, ValueError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def _store_cached_automaton(
+    automaton: 'ahocorasick.Automaton', path: Path
+) -> None:
+    """Save a built automaton to disk; caching is best-effort only."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        automaton.save(str(path), pickle.dumps)
+    except OSError:
+        pass
 
 
 class JobAdAnalyser:
@@ -29,173 +96,341 @@ class JobAdAnalyser:
         self,
         bias_terms_path: Optional[Path] = None,
         use_spacy: bool = True,
-        spacy_model: str = "en_core_web_sm",
     ):
         """
         Initialize the analyser.
-        
+
         Args:
             bias_terms_path: Path to bias terms CSV. Uses default if None.
             use_spacy: Whether to use spaCy for text processing.
-            spacy_model: Name of spaCy model to load.
         """
         # Load bias terms
         loader = BiasTermsLoader(bias_terms_path)
+        self.bias_terms_path: Path = loader.terms_path
         self.terms: List[FlaggedTerm] = loader.load()
-        
-        # Initialize spaCy if available and requested
-        self._nlp: Optional['Language'] = None
-        if use_spacy and _HAS_SPACY:
-            try:
-                self._nlp = spacy.load(
-                    spacy_model,
-                    disable=["ner", "tagger"]  # Disable unused components for speed
+
+        # Lower-case every term key exactly once at load time; all the
+        # matching structures below share these precomputed keys.
+        self._term_index: Dict[str, FlaggedTerm] = {
+            t.term.lower(): t for t in self.terms
+        }
+
+        # Precompile all term patterns into a single alternation regex so
+        # analyse() scans the text exactly once instead of once per term.
+        # Longest terms first so multi-word terms win over their substrings.
+        sorted_keys = sorted(self._term_index, key=len, reverse=True)
+        pattern = r'\b(?:' + '|'.join(map(re.escape, sorted_keys)) + r')\b'
+        self._term_regex = re.compile(pattern, re.IGNORECASE)
+
+        # Lower-case exception phrases once at load time so the hot loop
+        # never re-folds these constant strings per match, and compile each
+        # term's exceptions into one alternation so the context check is a
+        # single C-level search instead of a Python loop of substring scans.
+        self._exceptions_lower: Dict[str, Tuple[str, ...]] = {
+            key: tuple(e.lower() for e in term.context_exceptions)
+            for key, term in self._term_index.items()
+            if term.context_exceptions
+        }
+        # Single-word exceptions become hashed sets checked against the
+        # context's token set; only multi-word phrases need a substring
+        # search, via one compiled alternation per term.
+        self._exception_words: Dict[str, frozenset] = {}
+        self._exception_regexes: Dict[str, 're.Pattern[str]'] = {}
+        for key, exceptions in self._exceptions_lower.items():
+            words = frozenset(
+                e for e in exceptions if _SINGLE_WORD_RE.fullmatch(e)
+            )
+            phrases = [e for e in exceptions if e not in words]
+            if words:
+                self._exception_words[key] = words
+            if phrases:
+                self._exception_regexes[key] = re.compile(
+                    '|'.join(map(re.escape, phrases))
                 )
-            except OSError:
-                print(f"Warning: spaCy model '{spacy_model}' not found. "
-                      f"Run: python -m spacy download {spacy_model}")
-                print("Falling back to regex-only mode.")
-                self._nlp = None
+
+        # Prefer an Aho-Corasick automaton when available: one linear pass
+        # matches the whole dictionary regardless of how many terms it holds.
+        # (SIMD engines like Hyperscan were considered but report byte
+        # offsets on encoded input, which would break the character-offset
+        # positions MatchResult exposes for non-ASCII ads.)
+        self._automaton: Optional['ahocorasick.Automaton'] = None
+        if _HAS_AHOCORASICK:
+            cache_path = _automaton_cache_path(self._term_index)
+            automaton = _load_cached_automaton(cache_path)
+            if automaton is None:
+                automaton = ahocorasick.Automaton()
+                for key in self._term_index:
+                    automaton.add_word(key, key)
+                automaton.make_automaton()
+                _store_cached_automaton(automaton, cache_path)
+            self._automaton = automaton
+
+        # Initialize spaCy if available and requested. Only sentence
+        # boundaries are consumed downstream, so a blank pipeline with the
+        # rule-based sentencizer is all that's needed — no trained model
+        # download, and no parser running on every call.
+        self._nlp = _load_sentencizer() if use_spacy else None
+
+        # LRU cache of sentence splits: the webapp and retry paths often
+        # re-analyse identical text, so don't re-segment it each time.
+        # Locked because the webapp shares one analyser across its
+        # worker threads, where an unlocked move_to_end can race an
+        # evicting insert.
+        self._sentence_cache: OrderedDict[str, List[Tuple[int, int, str]]] = (
+            OrderedDict()
+        )
+        self._sentence_cache_size = 256
+        self._sentence_cache_lock = threading.Lock()
     
-    def _get_sentences(self, text: str) -> List[str]:
+    @staticmethod
+    def _sentence_spans(doc) -> List[Tuple[int, int, str]]:
+        """Extract (start, end, text) sentence spans from a parsed spaCy Doc."""
+        return [
+            (sent.start_char, sent.end_char, sent.text.strip())
+            for sent in doc.sents
+        ]
+
+    def _get_sentences(self, text: str) -> List[Tuple[int, int, str]]:
         """
         Split text into sentences using spaCy or fallback regex.
-        
+
         Args:
             text: Input text to split.
-            
+
         Returns:
-            List of sentences.
+            List of (start_offset, end_offset, sentence) tuples.
         """
+        with self._sentence_cache_lock:
+            cached = self._sentence_cache.get(text)
+            if cached is not None:
+                self._sentence_cache.move_to_end(text)
+                return cached
+
         if self._nlp:
-            doc = self._nlp(text)
-            return [sent.text.strip() for sent in doc.sents]
-        
-        # Fallback: naive sentence splitting
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        return [s.strip() for s in sentences if s.strip()]
-    
+            sentences = self._sentence_spans(self._nlp(text))
+        else:
+            sentences = self._split_sentences_fallback(text)
+
+        with self._sentence_cache_lock:
+            self._sentence_cache[text] = sentences
+            if len(self._sentence_cache) > self._sentence_cache_size:
+                self._sentence_cache.popitem(last=False)
+        return sentences
+
+    @staticmethod
+    def _split_sentences_fallback(text: str) -> List[Tuple[int, int, str]]:
+        """Naive regex-based sentence splitting, tracking offsets as we go."""
+        sentences: List[Tuple[int, int, str]] = []
+        start = 0
+        for separator in _SENT_SPLIT_RE.finditer(text):
+            sentence = text[start:separator.start()].strip()
+            if sentence:
+                sentences.append((start, separator.start(), sentence))
+            start = separator.end()
+
+        tail = text[start:].strip()
+        if tail:
+            sentences.append((start, len(text), tail))
+
+        return sentences
+
     def _find_sentence_for_offset(
         self,
-        sentences: List[str],
-        original_text: str,
+        sentences: List[Tuple[int, int, str]],
+        sentence_starts: List[int],
         offset: int
-    ) -> str:
+    ) -> Optional[Tuple[int, int, str]]:
         """
-        Find the sentence containing a specific character offset.
-        
+        Find the sentence span containing a specific character offset.
+
+        Sentence boundaries are already known from segmentation, so the
+        lookup is a binary search over the start offsets rather than a
+        linear str.find scan per match.
+
         Args:
-            sentences: List of sentences from the text.
-            original_text: The complete original text.
+            sentences: List of (start, end, sentence) tuples.
+            sentence_starts: Sorted list of sentence start offsets.
             offset: Character offset to locate.
-            
+
         Returns:
-            The sentence containing the offset, or empty string.
-        """
-        running = 0
-        for sent in sentences:
-            # Find this sentence in the original text
-            sent_start = original_text.find(sent, running)
-            if sent_start == -1:
-                running += len(sent) + 1
-                continue
-            
-            sent_end = sent_start + len(sent)
-            if sent_start <= offset <= sent_end:
-                return sent
-            
-            running = sent_end
-        
-        return ""
+            The (start, end, sentence) span containing the offset, or None.
+        """
+        idx = bisect_right(sentence_starts, offset) - 1
+        if 0 <= idx < len(sentences) and offset <= sentences[idx][1]:
+            return sentences[idx]
+        return None
     
-    def _is_exception_context(self, term: FlaggedTerm, context: str) -> bool:
+    def _iter_automaton_matches(self, lower_text: str):
         """
-        Check if term appears in an exception context.
-        
+        Yield (term_key, start_offset) for every dictionary term in the text.
+
+        The automaton matches raw substrings, so word boundaries are
+        enforced manually by inspecting the surrounding characters.
+
         Args:
-            term: The flagged term to check.
-            context: The surrounding context.
-            
+            lower_text: Lowercased text to scan.
+
+        Yields:
+            Tuples of (lowercased term, character offset of match start).
+        """
+        text_len = len(lower_text)
+        for end_idx, term_key in self._automaton.iter_long(lower_text):
+            start = end_idx - len(term_key) + 1
+            if start > 0:
+                before = lower_text[start - 1]
+                if before.isalnum() or before == '_':
+                    continue
+            if end_idx + 1 < text_len:
+                after = lower_text[end_idx + 1]
+                if after.isalnum() or after == '_':
+                    continue
+            yield term_key, start
+
+    def _is_exception_context(self, term_key: str, context_lower: str) -> bool:
+        """
+        Check if a term appears in an exception context.
+
+        Args:
+            term_key: Lowercased dictionary key of the flagged term.
+            context_lower: The surrounding context, already lowercased.
+
         Returns:
             True if this is an exception case (should not be flagged).
         """
-        if not term.context_exceptions:
-            return False
-        
-        context_lower = context.lower()
-        for exception in term.context_exceptions:
-            if exception.lower() in context_lower:
+        words = self._exception_words.get(term_key)
+        if words is not None:
+            tokens = _NON_WORD_RE.split(context_lower)
+            if not words.isdisjoint(tokens):
                 return True
-        
-        return False
+
+        pattern = self._exception_regexes.get(term_key)
+        return pattern is not None and pattern.search(context_lower) is not None
     
-    def analyse(self, text: str) -> List[MatchResult]:
+    def analyse(
+        self,
+        text: str,
+        text_lower: Optional[str] = None,
+    ) -> List[MatchResult]:
         """
         Scan text for biased terms and return match results.
         
         Args:
             text: Job ad text to analyse.
+            text_lower: Pre-lowered copy of the text, if the caller has
+                already folded it for another stage.
             
         Returns:
             List of MatchResult objects for each biased term found.
         """
         if not text or not text.strip():
             return []
-        
-        results: List[MatchResult] = []
-        lower_text = text.lower()
-        sentences = self._get_sentences(text)
-        
-        # Track terms we've already matched to avoid duplicates
-        seen_terms: Set[str] = set()
-        
-        for term in self.terms:
-            term_key = term.term.lower()
-            if term_key in seen_terms:
+
+        return self._analyse_with_sentences(
+            text, self._get_sentences(text), text_lower
+        )
+
+    def analyse_many(
+        self,
+        texts: List[str],
+        batch_size: int = 64,
+        n_process: int = 1,
+    ) -> List[List[MatchResult]]:
+        """
+        Analyse a batch of texts, sharing spaCy pipeline overhead.
+
+        Sentence segmentation runs through nlp.pipe so per-document setup
+        cost is amortized across the batch. Falls back to per-text
+        analysis when spaCy is unavailable.
+
+        Args:
+            texts: Job ad texts to analyse.
+            batch_size: spaCy pipe batch size.
+            n_process: Number of spaCy worker processes (1 = in-process).
+
+        Returns:
+            One list of MatchResult objects per input text, in order.
+        """
+        if not self._nlp:
+            return [self.analyse(text) for text in texts]
+
+        results: List[List[MatchResult]] = []
+        docs = self._nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        for text, doc in zip(texts, docs):
+            if not text or not text.strip():
+                results.append([])
                 continue
-            
-            # Create regex pattern with word boundaries
-            # Escape special regex characters in the term
-            escaped_term = re.escape(term_key)
-            pattern = r'\b' + escaped_term + r'\b'
-            
-            positions: List[int] = []
-            contexts: List[str] = []
-            valid_matches = 0
-            
-            # Find all matches
-            for match in re.finditer(pattern, lower_text):
-                start = match.start()
-                
-                # Get sentence context
-                sentence_context = self._find_sentence_for_offset(
-                    sentences, text, start
-                )
-                
-                # Check if this is an exception context
-                if self._is_exception_context(term, sentence_context):
+            results.append(
+                self._analyse_with_sentences(text, self._sentence_spans(doc))
+            )
+        return results
+
+    def _analyse_with_sentences(
+        self,
+        text: str,
+        sentences: List[Tuple[int, int, str]],
+        text_lower: Optional[str] = None,
+    ) -> List[MatchResult]:
+        """Run term matching against text with pre-computed sentence spans."""
+        sentence_starts = [s[0] for s in sentences]
+
+        # Aggregate matches per term in a single pass over the text.
+        # The automaton matches lowercase literals and needs one folded
+        # copy of the text; the IGNORECASE regex fallback scans the
+        # original directly and folds only what it touches.
+        lower_text: Optional[str] = None
+        if self._automaton is not None:
+            lower_text = text_lower if text_lower is not None else text.lower()
+            term_matches = self._iter_automaton_matches(lower_text)
+        else:
+            term_matches = (
+                (match.group(0).lower(), match.start())
+                for match in self._term_regex.finditer(text)
+            )
+
+        positions_by_term: Dict[str, List[int]] = defaultdict(list)
+        contexts_by_term: Dict[str, List[str]] = defaultdict(list)
+
+        # Bind the per-match helpers to locals so the loop resolves them
+        # from fast local slots instead of repeating attribute lookups
+        find_sentence = self._find_sentence_for_offset
+        is_exception = self._is_exception_context
+
+        for term_key, start in term_matches:
+            # Get sentence context
+            span = find_sentence(sentences, sentence_starts, start)
+
+            if span is not None:
+                sent_start, sent_end, sentence_context = span
+                # Slice the exception-check context from the text we
+                # already lowercased instead of re-folding the sentence
+                if lower_text is not None:
+                    context_lower = lower_text[sent_start:sent_end]
+                else:
+                    context_lower = text[sent_start:sent_end].lower()
+                if is_exception(term_key, context_lower):
                     continue
-                
-                positions.append(start)
-                contexts.append(sentence_context)
-                valid_matches += 1
-            
-            # Only add to results if we found valid matches
-            if valid_matches > 0:
-                seen_terms.add(term_key)
-                results.append(
-                    MatchResult(
-                        term=term.term,
-                        category=term.category,
-                        severity=term.severity,
-                        suggestion=term.suggestion,
-                        explanation=term.explanation,
-                        count=valid_matches,
-                        positions=positions,
-                        contexts=contexts,
-                    )
+            else:
+                sentence_context = ""
+
+            positions_by_term[term_key].append(start)
+            contexts_by_term[term_key].append(sentence_context)
+
+        results: List[MatchResult] = []
+        for term_key, positions in positions_by_term.items():
+            term = self._term_index[term_key]
+            results.append(
+                MatchResult(
+                    term=term.term,
+                    category=term.category,
+                    severity=term.severity,
+                    suggestion=term.suggestion,
+                    explanation=term.explanation,
+                    count=len(positions),
+                    positions=positions,
+                    contexts=contexts_by_term[term_key],
                 )
-        
+            )
+
         return results
     
     def get_statistics(self) -> dict:
@@ -205,15 +440,11 @@ class JobAdAnalyser:
         Returns:
             Dictionary with term counts by category and severity.
         """
-        categories = {}
-        severities = {}
-        
-        for term in self.terms:
-            categories[term.category] = categories.get(term.category, 0) + 1
-            severities[term.severity] = severities.get(term.severity, 0) + 1
-        
+        categories = Counter(term.category for term in self.terms)
+        severities = Counter(term.severity for term in self.terms)
+
         return {
             "total_terms": len(self.terms),
-            "by_category": categories,
-            "by_severity": severities,
+            "by_category": dict(categories),
+            "by_severity": dict(severities),
         }
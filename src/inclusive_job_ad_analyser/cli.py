@@ -2,11 +2,15 @@
 Command-line interface for the Inclusive Job Ad Analyser.
 """
 
+import fnmatch
+import os
 import sys
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional, List
 import csv
+from datetime import datetime
 
 from inclusive_job_ad_analyser.analyser import JobAdAnalyser
 from inclusive_job_ad_analyser.scraper import JobAdScraper
@@ -18,7 +22,7 @@ from inclusive_job_ad_analyser.scoring import (
     generate_recommendations,
 )
 from inclusive_job_ad_analyser.models import AnalysisResult
-from inclusive_job_ad_analyser.reporting import ReportGenerator
+from inclusive_job_ad_analyser.reporting import ReportGenerator, _TS_FMT
 from inclusive_job_ad_analyser.loaders import ConfigLoader
 
 
@@ -38,23 +42,74 @@ def analyse_text(
     Returns:
         Complete AnalysisResult object.
     """
-    # Run analysis
-    matches = analyser.analyse(text)
-    
+    # Fold the text once; the matcher and the positive-indicator scan
+    # both want a lowered copy
+    text_lower = text.lower()
+    matches = analyser.analyse(text, text_lower=text_lower)
+    return _build_result(text, matches, config, text_lower)
+
+
+def analyse_texts(
+    texts: List[str],
+    analyser: JobAdAnalyser,
+    config: Optional[ConfigLoader] = None
+) -> List[AnalysisResult]:
+    """
+    Analyse a batch of job ad texts in one pipeline pass.
+
+    Matching runs through JobAdAnalyser.analyse_many so spaCy sentence
+    segmentation is batched across the texts instead of paying per-call
+    pipeline setup.
+
+    Args:
+        texts: Job ad texts to analyse.
+        analyser: Configured JobAdAnalyser instance.
+        config: Optional configuration loader.
+
+    Returns:
+        One complete AnalysisResult per input text, in order.
+    """
+    all_matches = analyser.analyse_many(texts)
+    return [
+        _build_result(text, matches, config)
+        for text, matches in zip(texts, all_matches)
+    ]
+
+
+def _build_result(
+    text: str,
+    matches: List,
+    config: Optional[ConfigLoader] = None,
+    text_lower: Optional[str] = None
+) -> AnalysisResult:
+    """
+    Build a complete AnalysisResult from pre-computed matches.
+
+    Args:
+        text: The analysed job ad text.
+        matches: MatchResult list from JobAdAnalyser.
+        config: Optional configuration loader.
+        text_lower: Pre-lowered copy of the text, folded here if absent.
+
+    Returns:
+        Complete AnalysisResult object.
+    """
+    if text_lower is None:
+        text_lower = text.lower()
+    # Word count, computed once and shared with the scorer
+    word_count = len(text.split())
+
     # Compute scores
-    overall_score = compute_bias_score(matches, text, config)
+    overall_score = compute_bias_score(matches, text, config, word_count)
     grade = get_grade(overall_score)
     category_scores = compute_category_scores(matches, config)
     
-    # Detect positive indicators
-    positive = detect_positive_indicators(text, config)
+    # Detect positive indicators against the shared lowered copy
+    positive = detect_positive_indicators(text, config, text_lower=text_lower)
     
     # Generate recommendations
     recommendations = generate_recommendations(matches, category_scores)
     
-    # Word count
-    word_count = len(text.split())
-    
     return AnalysisResult(
         text=text,
         overall_score=overall_score,
@@ -83,44 +138,183 @@ def analyse_file(
     Returns:
         Complete AnalysisResult object.
     """
+    return analyse_text(_read_text(file_path), analyser, config)
+
+
+def _read_text(file_path: Path) -> str:
+    """Read a text file, falling back to latin-1 for non-UTF8 content."""
+    # Read bytes once and retry the decode on the buffer, rather than
+    # hitting the disk a second time for non-UTF8 files
+    data = file_path.read_bytes()
+    return _decode_text(data)
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode raw bytes as UTF-8, falling back to latin-1."""
     try:
-        text = file_path.read_text(encoding='utf-8')
+        return data.decode('utf-8')
     except UnicodeDecodeError:
-        # Try alternative encodings
-        text = file_path.read_text(encoding='latin-1')
-    
-    return analyse_text(text, analyser, config)
+        return data.decode('latin-1', errors='replace')
+
+
+# Directories smaller than this are analysed in-process; forking workers
+# only pays off once there are enough files to amortize the startup cost.
+_PARALLEL_MIN_FILES = 16
+
+# Per-worker state for process-pool directory analysis
+_worker_analyser: Optional[JobAdAnalyser] = None
+_worker_config: Optional[ConfigLoader] = None
+
+
+def _init_directory_worker(
+    terms_path: Optional[str],
+    use_spacy: bool,
+    config_path: Optional[str]
+) -> None:
+    """Build the analyser/config once per worker process."""
+    global _worker_analyser, _worker_config
+    _worker_analyser = JobAdAnalyser(
+        bias_terms_path=Path(terms_path) if terms_path else None,
+        use_spacy=use_spacy,
+    )
+    _worker_config = ConfigLoader(Path(config_path)) if config_path else None
+
+
+def _analyse_path_worker(path_str: str) -> AnalysisResult:
+    """Analyse a single file inside a worker process."""
+    return analyse_file(Path(path_str), _worker_analyser, _worker_config)
+
+
+def _matching_files(dir_path: Path, pattern: str) -> List[Path]:
+    """
+    List files in a directory matching a glob-style pattern.
+
+    Uses os.scandir so huge directories are walked in a single readdir
+    pass with cached file types, and short-circuits the common "*.ext"
+    pattern to a plain suffix check instead of fnmatch.
+
+    Args:
+        dir_path: Directory to scan.
+        pattern: Glob pattern for file names.
+
+    Returns:
+        List of matching file paths.
+    """
+    suffix = None
+    if pattern.startswith('*') and not any(c in pattern[1:] for c in '*?['):
+        suffix = pattern[1:]
+
+    paths: List[Path] = []
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if suffix is not None:
+                if not entry.name.endswith(suffix):
+                    continue
+            elif not fnmatch.fnmatchcase(entry.name, pattern):
+                continue
+            if entry.is_file():
+                paths.append(Path(entry.path))
+
+    return paths
 
 
 def analyse_directory(
     dir_path: Path,
     analyser: JobAdAnalyser,
     config: Optional[ConfigLoader] = None,
-    pattern: str = "*.txt"
+    pattern: str = "*.txt",
+    max_workers: Optional[int] = None
 ) -> List[tuple[str, AnalysisResult]]:
     """
     Analyse all matching files in a directory.
-    
+
+    Large directories are fanned out over a process pool (each file is
+    independent); small ones run in-process as a single spaCy batch.
+
     Args:
         dir_path: Directory to scan.
         analyser: Configured JobAdAnalyser instance.
         config: Optional configuration loader.
         pattern: Glob pattern for files to analyse.
-        
+        max_workers: Worker process count. Defaults to the CPU count.
+
     Returns:
         List of (filename, result) tuples.
     """
+    paths = _matching_files(dir_path, pattern)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if len(paths) >= _PARALLEL_MIN_FILES and max_workers > 1:
+        return _analyse_directory_parallel(paths, analyser, config, max_workers)
+
+    named_texts: List[tuple[str, str]] = []
+
+    for file_path in paths:
+        try:
+            named_texts.append((file_path.name, _read_text(file_path)))
+        except Exception as e:
+            print(f"✗ Error analysing {file_path.name}: {e}", file=sys.stderr)
+
+    # Batch the analysis so spaCy segments all files in one pipe() call.
+    # One pathological file (e.g. text beyond spaCy's max_length) makes
+    # the whole nlp.pipe batch raise, so on batch failure fall back to
+    # analysing per file — matching the per-file isolation the process-
+    # pool path keeps for large directories.
+    try:
+        matches_per_file = analyser.analyse_many(
+            [text for _, text in named_texts]
+        )
+    except Exception:
+        matches_per_file = []
+        for filename, text in named_texts:
+            try:
+                matches_per_file.append(analyser.analyse(text))
+            except Exception as e:
+                print(f"✗ Error analysing {filename}: {e}", file=sys.stderr)
+                matches_per_file.append(None)
+
     results = []
-    
-    for file_path in dir_path.glob(pattern):
-        if file_path.is_file():
+    for (filename, text), matches in zip(named_texts, matches_per_file):
+        if matches is None:
+            continue
+        results.append((filename, _build_result(text, matches, config)))
+        print(f"✓ Analysed: {filename}", file=sys.stderr)
+
+    return results
+
+
+def _analyse_directory_parallel(
+    paths: List[Path],
+    analyser: JobAdAnalyser,
+    config: Optional[ConfigLoader],
+    max_workers: int
+) -> List[tuple[str, AnalysisResult]]:
+    """Fan file analysis out over a process pool, preserving input order."""
+    initargs = (
+        str(analyser.bias_terms_path),
+        analyser._nlp is not None,
+        str(config.config_path) if config else None,
+    )
+
+    results: List[tuple[str, AnalysisResult]] = []
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_directory_worker,
+        initargs=initargs,
+    ) as executor:
+        futures = [
+            (path, executor.submit(_analyse_path_worker, str(path)))
+            for path in paths
+        ]
+        for path, future in futures:
             try:
-                result = analyse_file(file_path, analyser, config)
-                results.append((file_path.name, result))
-                print(f"✓ Analysed: {file_path.name}", file=sys.stderr)
+                results.append((path.name, future.result()))
+                print(f"✓ Analysed: {path.name}", file=sys.stderr)
             except Exception as e:
-                print(f"✗ Error analysing {file_path.name}: {e}", file=sys.stderr)
-    
+                print(f"✗ Error analysing {path.name}: {e}", file=sys.stderr)
+
     return results
 
 
@@ -278,8 +472,9 @@ Examples:
     # Process input
     try:
         if args.stdin:
-            # Read from stdin
-            text = sys.stdin.read()
+            # Read stdin as bytes and decode once, so piped non-UTF8
+            # content gets the same fallback handling as files
+            text = _decode_text(sys.stdin.buffer.read())
             result = analyse_text(text, analyser, config)
             results = [("stdin", result)]
         
@@ -319,7 +514,7 @@ Examples:
                        if line.strip() and not line.startswith('#')]
                 
                 print(f"Scraping {len(urls)} URLs...", file=sys.stderr)
-                scraped_jobs = scraper.scrape_multiple(urls)
+                scraped_jobs = scraper.scrape_multiple_concurrent(urls)
                 
                 results = []
                 for job in scraped_jobs:
@@ -438,33 +633,44 @@ Examples:
                 output = json.dumps(data, indent=2, ensure_ascii=False)
         
         elif args.format == 'csv':
-            # CSV format (for batch processing)
-            import io
-            output_buffer = io.StringIO()
-            
-            if results:
-                # Get all possible column names
-                first_result = results[0][1]
-                sample_row = reporter.generate_csv_row(results[0][0], first_result)
-                fieldnames = list(sample_row.keys())
-                
-                writer = csv.DictWriter(output_buffer, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for filename, result in results:
-                    row = reporter.generate_csv_row(filename, result)
-                    writer.writerow(row)
-            
-            output = output_buffer.getvalue()
+            # CSV format (for batch processing). Rows are streamed
+            # straight to the destination instead of buffered in memory.
+            out = (
+                open(args.output, 'w', newline='', encoding='utf-8')
+                if args.output else sys.stdout
+            )
+            try:
+                if results:
+                    # Get all possible column names
+                    first_result = results[0][1]
+                    sample_row = reporter.generate_csv_row(results[0][0], first_result)
+                    fieldnames = list(sample_row.keys())
+
+                    writer = csv.DictWriter(out, fieldnames=fieldnames)
+                    writer.writeheader()
+                    writer.writerow(sample_row)
+
+                    for filename, result in results[1:]:
+                        writer.writerow(reporter.generate_csv_row(filename, result))
+            finally:
+                if args.output:
+                    out.close()
+            # Only reached when every row streamed without raising
+            if args.output:
+                print(f"Report written to: {args.output}", file=sys.stderr)
+
+            output = None
         
         elif args.format == 'markdown':
             # Markdown format
             if len(results) == 1:
                 output = reporter.generate_markdown_report(results[0][1])
             else:
-                # Multiple results concatenated
+                # Multiple results concatenated, sharing one footer timestamp
+                now = datetime.now().strftime(_TS_FMT)
                 output = "\n\n---\n\n".join(
-                    f"# Analysis: {filename}\n\n{reporter.generate_markdown_report(result)}"
+                    f"# Analysis: {filename}\n\n"
+                    f"{reporter.generate_markdown_report(result, now=now)}"
                     for filename, result in results
                 )
         
@@ -474,18 +680,21 @@ Examples:
             if len(results) == 1:
                 output = reporter.generate_text_report(results[0][1], colored)
             else:
-                # Multiple results concatenated
+                # Multiple results concatenated, sharing one footer timestamp
+                now = datetime.now().strftime(_TS_FMT)
                 output = "\n\n".join(
-                    f"=== {filename} ===\n{reporter.generate_text_report(result, colored)}"
+                    f"=== {filename} ===\n"
+                    f"{reporter.generate_text_report(result, colored, now=now)}"
                     for filename, result in results
                 )
         
-        # Write output
-        if args.output:
-            Path(args.output).write_text(output, encoding='utf-8')
-            print(f"Report written to: {args.output}", file=sys.stderr)
-        else:
-            print(output)
+        # Write output (CSV has already been streamed above)
+        if output is not None:
+            if args.output:
+                Path(args.output).write_text(output, encoding='utf-8')
+                print(f"Report written to: {args.output}", file=sys.stderr)
+            else:
+                print(output)
         
         # Exit code based on results
         # Non-zero if any result has score below 60 (Poor grade)
@@ -3,13 +3,83 @@ Utilities for loading configuration and data files.
 """
 
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+import csv
+import pickle
 import yaml
-import pandas as pd
+
+try:
+    # libyaml's C parser when PyYAML was built against it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 from .models import FlaggedTerm
 
 
+def _load_with_pickle_cache(source_path: Path, parse: Callable[[], Any]) -> Any:
+    """
+    Parse a data file, caching the result in a pickle sidecar.
+
+    The sidecar lives next to the source file (suffixed .pkl) and is
+    trusted while its mtime is at least the source's, so repeated CLI
+    invocations skip YAML/CSV parsing entirely. Cache reads and writes
+    fail soft — a read-only install simply parses every time.
+
+    Args:
+        source_path: The YAML/CSV file being loaded.
+        parse: Zero-argument callable producing the parsed value.
+
+    Returns:
+        The parsed (or cached) value.
+    """
+    cache_path = source_path.with_suffix(source_path.suffix + '.pkl')
+
+    try:
+        if cache_path.stat().st_mtime >= source_path.stat().st_mtime:
+            return pickle.loads(cache_path.read_bytes())
+    except (OSError, pickle.PickleError, EOFError, AttributeError):
+        pass
+
+    value = parse()
+
+    try:
+        cache_path.write_bytes(
+            pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+    except OSError:
+        pass
+
+    return value
+
+
+def _flatten_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten a nested config dict into dotted-path keys.
+
+    Every node is stored — subtrees under their prefix as well as leaf
+    values — so any key the dot-walking lookup could resolve is a single
+    dict hit here.
+
+    Args:
+        config: Parsed configuration mapping.
+
+    Returns:
+        Mapping of dotted paths to values.
+    """
+    flat: Dict[str, Any] = {}
+
+    def walk(prefix: str, node: Dict[str, Any]) -> None:
+        for key, value in node.items():
+            path = prefix + key
+            flat[path] = value
+            if isinstance(value, dict):
+                walk(path + '.', value)
+
+    walk('', config or {})
+    return flat
+
+
 class ConfigLoader:
     """Load and manage configuration files."""
     
@@ -27,27 +97,31 @@ class ConfigLoader:
         
         self.config_path = Path(config_path)
         self._config: Optional[Dict[str, Any]] = None
+        self._flat: Optional[Dict[str, Any]] = None
     
     def load(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         if self._config is None:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self._config = yaml.safe_load(f)
+            self._config = _load_with_pickle_cache(
+                self.config_path, self._parse
+            )
         return self._config
+
+    def _parse(self) -> Dict[str, Any]:
+        """Parse the YAML config from disk."""
+        with open(self.config_path, 'r', encoding='utf-8') as f:
+            return yaml.load(f, Loader=_YamlLoader)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value by key (supports dot notation)."""
-        config = self.load()
-        keys = key.split('.')
-        value = config
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return default
-            if value is None:
-                return default
-        return value
+        # Scoring functions call this inside per-match loops, so lookups
+        # go through a flattened dotted-path index instead of splitting
+        # the key and walking the nested dict every time.
+        if self._flat is None:
+            self._flat = _flatten_config(self.load())
+
+        value = self._flat.get(key)
+        return default if value is None else value
 
 
 class BiasTermsLoader:
@@ -71,29 +145,34 @@ class BiasTermsLoader:
     def load(self) -> List[FlaggedTerm]:
         """Load bias terms from CSV file."""
         if self._terms is None:
-            df = pd.read_csv(self.terms_path)
-            self._terms = []
-            
-            for _, row in df.iterrows():
-                # Handle context exceptions (pipe-separated)
-                exceptions = []
-                if pd.notna(row.get('context_exceptions', '')):
-                    exceptions_str = str(row['context_exceptions'])
-                    if exceptions_str.strip():
-                        exceptions = [e.strip() for e in exceptions_str.split('|')]
-                
-                term = FlaggedTerm(
+            self._terms = _load_with_pickle_cache(
+                self.terms_path, self._parse
+            )
+        return self._terms
+
+    def _parse(self) -> List[FlaggedTerm]:
+        """Parse the bias terms CSV from disk."""
+        # The terms table is a small all-string CSV, so the stdlib
+        # reader does everything needed without paying pandas' import
+        # and DataFrame-construction cost on every process start.
+        with open(self.terms_path, newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            return [
+                FlaggedTerm(
                     term=row['term'],
                     category=row['category'],
                     severity=row['severity'],
                     suggestion=row['suggestion'],
-                    explanation=row.get('explanation', ''),
-                    context_exceptions=exceptions
+                    explanation=row.get('explanation') or '',
+                    context_exceptions=[
+                        e.strip()
+                        for e in (row.get('context_exceptions') or '').split('|')
+                        if e.strip()
+                    ],
                 )
-                self._terms.append(term)
-        
-        return self._terms
-    
+                for row in reader
+            ]
+
     def get_by_category(self, category: str) -> List[FlaggedTerm]:
         """Get all terms for a specific category."""
         terms = self.load()
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class FlaggedTerm:
     """A potentially biased term from the dictionary."""
     term: str
@@ -17,7 +17,7 @@ class FlaggedTerm:
     context_exceptions: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """Result of finding a biased term in text."""
     term: str
@@ -30,7 +30,7 @@ class MatchResult:
     contexts: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryScore:
     """Score breakdown for a specific bias category."""
     category: str
@@ -39,7 +39,7 @@ class CategoryScore:
     max_severity: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Complete analysis result for a job ad."""
     text: str
@@ -53,6 +53,21 @@ class AnalysisResult:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
+        # Preallocate the issues list so results with many matches fill
+        # slots in place instead of growing the list append by append.
+        issues: List[Dict[str, Any]] = [None] * len(self.matches)
+        for i, m in enumerate(self.matches):
+            issues[i] = {
+                "term": m.term,
+                "category": m.category,
+                "severity": m.severity,
+                "count": m.count,
+                "suggestion": m.suggestion,
+                "explanation": m.explanation,
+                "positions": m.positions,
+                "contexts": m.contexts[:3],  # Limit contexts to first 3
+            }
+
         return {
             "overall_score": self.overall_score,
             "grade": self.grade,
@@ -66,19 +81,7 @@ class AnalysisResult:
                 for cat, score in self.category_scores.items()
             },
             "issues_found": len(self.matches),
-            "issues": [
-                {
-                    "term": m.term,
-                    "category": m.category,
-                    "severity": m.severity,
-                    "count": m.count,
-                    "suggestion": m.suggestion,
-                    "explanation": m.explanation,
-                    "positions": m.positions,
-                    "contexts": m.contexts[:3],  # Limit contexts to first 3
-                }
-                for m in self.matches
-            ],
+            "issues": issues,
             "recommendations": self.recommendations,
             "positive_aspects": self.positive_aspects,
         }
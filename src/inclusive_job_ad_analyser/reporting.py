@@ -21,18 +21,39 @@ except ImportError:
         BRIGHT = DIM = RESET_ALL = ""
 
 
+# Timestamp format shared by the text and markdown report footers
+_TS_FMT = '%Y-%m-%d %H:%M:%S'
+
+try:
+    import orjson
+
+    def _dumps(data: dict) -> str:
+        """Serialize a report dict to pretty-printed JSON via orjson."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(data: dict) -> str:
+        """Serialize a report dict to pretty-printed JSON via stdlib json."""
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+
 class ReportGenerator:
     """Generate reports in various formats."""
     
     @staticmethod
-    def generate_text_report(result: AnalysisResult, colored: bool = True) -> str:
+    def generate_text_report(
+        result: AnalysisResult,
+        colored: bool = True,
+        now: Optional[str] = None,
+    ) -> str:
         """
         Generate a human-readable text report.
-        
+
         Args:
             result: Analysis result to report on.
             colored: Whether to use terminal colors (requires colorama).
-            
+            now: Pre-formatted timestamp for the footer. Batch callers
+                pass one shared timestamp instead of formatting per report.
+
         Returns:
             Formatted text report.
         """
@@ -50,11 +71,14 @@ class ReportGenerator:
             style_reset = Style.RESET_ALL
         
         lines = []
+        write = lines.append
+        bar = "-" * 60
+        hbar = "=" * 60
         
         # Header
-        lines.append(f"\n{style_bright}{'=' * 60}")
-        lines.append("INCLUSIVE JOB AD ANALYSIS REPORT")
-        lines.append(f"{'=' * 60}{style_reset}\n")
+        write(f"\n{style_bright}{hbar}")
+        write("INCLUSIVE JOB AD ANALYSIS REPORT")
+        write(f"{hbar}{style_reset}\n")
         
         # Overall score
         score = result.overall_score
@@ -73,14 +97,14 @@ class ReportGenerator:
             color = fore_red
             emoji = "❌"
         
-        lines.append(f"{style_bright}Overall Score: {color}{score}/100{style_reset} ({grade}) {emoji}")
-        lines.append(f"Word Count: {result.word_count}")
-        lines.append(f"Issues Found: {len(result.matches)}\n")
+        write(f"{style_bright}Overall Score: {color}{score}/100{style_reset} ({grade}) {emoji}")
+        write(f"Word Count: {result.word_count}")
+        write(f"Issues Found: {len(result.matches)}\n")
         
         # Category breakdown
         if result.category_scores:
-            lines.append(f"{style_bright}CATEGORY BREAKDOWN:{style_reset}")
-            lines.append("-" * 60)
+            write(f"{style_bright}CATEGORY BREAKDOWN:{style_reset}")
+            write(bar)
             
             for category, cat_score in sorted(
                 result.category_scores.items(),
@@ -99,26 +123,30 @@ class ReportGenerator:
                     cat_color = fore_red
                     cat_emoji = "❌"
                 
-                lines.append(
+                write(
                     f"{cat_name:20} {cat_color}{score_val:5.1f}/100{style_reset} "
                     f"{cat_emoji}  ({cat_score.issues_count} issue(s), "
                     f"max: {cat_score.max_severity})"
                 )
             
-            lines.append("")
+            write("")
         
         # Issues by severity
         if result.matches:
-            lines.append(f"{style_bright}ISSUES DETECTED:{style_reset}")
-            lines.append("-" * 60)
+            write(f"{style_bright}ISSUES DETECTED:{style_reset}")
+            write(bar)
             
-            # Group by severity
+            # Group by severity in a single pass over the matches
             severity_order = ['critical', 'high', 'medium', 'low']
+            by_sev: Dict[str, List[MatchResult]] = {}
+            for m in result.matches:
+                by_sev.setdefault(m.severity, []).append(m)
+
             for severity in severity_order:
-                matches_by_sev = [m for m in result.matches if m.severity == severity]
+                matches_by_sev = by_sev.get(severity)
                 if not matches_by_sev:
                     continue
-                
+
                 # Severity header
                 sev_color = {
                     'critical': fore_red,
@@ -127,62 +155,70 @@ class ReportGenerator:
                     'low': fore_cyan,
                 }.get(severity, "")
                 
-                lines.append(f"\n{style_bright}{sev_color}{severity.upper()} SEVERITY:{style_reset}")
+                write(f"\n{style_bright}{sev_color}{severity.upper()} SEVERITY:{style_reset}")
                 
                 for i, match in enumerate(matches_by_sev, 1):
-                    lines.append(f"\n{i}. '{match.term}' [{match.category}] (found {match.count}x)")
-                    lines.append(f"   Issue: {match.explanation}")
-                    lines.append(f"   Suggestion: {fore_green}{match.suggestion}{style_reset}")
+                    write(f"\n{i}. '{match.term}' [{match.category}] (found {match.count}x)")
+                    write(f"   Issue: {match.explanation}")
+                    write(f"   Suggestion: {fore_green}{match.suggestion}{style_reset}")
                     
                     if match.contexts:
                         context = match.contexts[0][:100]
                         if len(match.contexts[0]) > 100:
                             context += "..."
-                        lines.append(f"   Context: \"{context}\"")
+                        write(f"   Context: \"{context}\"")
             
-            lines.append("")
+            write("")
         
         # Recommendations
         if result.recommendations:
-            lines.append(f"\n{style_bright}RECOMMENDATIONS:{style_reset}")
-            lines.append("-" * 60)
+            write(f"\n{style_bright}RECOMMENDATIONS:{style_reset}")
+            write(bar)
             for rec in result.recommendations:
-                lines.append(f"{rec}")
-            lines.append("")
+                write(f"{rec}")
+            write("")
         
         # Positive aspects
         if result.positive_aspects:
-            lines.append(f"\n{style_bright}{fore_green}POSITIVE ASPECTS:{style_reset}")
-            lines.append("-" * 60)
+            write(f"\n{style_bright}{fore_green}POSITIVE ASPECTS:{style_reset}")
+            write(bar)
             for aspect in result.positive_aspects:
-                lines.append(f"✓ Contains '{aspect}'")
-            lines.append("")
+                write(f"✓ Contains '{aspect}'")
+            write("")
         
         # Footer
-        lines.append("-" * 60)
-        lines.append(f"Report generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append("")
+        write(bar)
+        if now is None:
+            now = datetime.now().strftime(_TS_FMT)
+        write(f"Report generated: {now}")
+        write("")
         
         return "\n".join(lines)
     
     @staticmethod
-    def generate_json_report(result: AnalysisResult) -> str:
+    def generate_json_report(
+        result: AnalysisResult,
+        now: Optional[str] = None,
+    ) -> str:
         """
         Generate a JSON report.
-        
+
         Args:
             result: Analysis result to report on.
-            
+            now: Pre-formatted ISO timestamp for the metadata block,
+                shared across a batch if supplied.
+
         Returns:
             JSON string.
         """
         data = result.to_dict()
         data['metadata'] = {
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': now if now is not None else datetime.now().isoformat(),
             'version': '1.0.0',
         }
-        
-        return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+        return _dumps(data)
     
     @staticmethod
     def generate_csv_row(
@@ -213,24 +249,82 @@ class ReportGenerator:
             row[col_name] = score.score
             row[f"{category}_issues"] = score.issues_count
         
-        # Count by severity
-        for severity in ['critical', 'high', 'medium', 'low']:
-            count = sum(
-                m.count for m in result.matches
-                if m.severity == severity
-            )
-            row[f"{severity}_count"] = count
-        
+        # Count by severity in one pass over the matches
+        sev_counts = {'critical': 0, 'high': 0, 'medium': 0, 'low': 0}
+        for m in result.matches:
+            sev_counts[m.severity] = sev_counts.get(m.severity, 0) + m.count
+        for severity in ('critical', 'high', 'medium', 'low'):
+            row[f"{severity}_count"] = sev_counts[severity]
+
         return row
+
+    @staticmethod
+    def generate_csv_rows_batch(results: List[tuple]) -> 'pandas.DataFrame':
+        """
+        Build a DataFrame of CSV rows for a whole batch of results.
+
+        Columns are assembled as whole lists rather than one dict per
+        row, so large batch exports skip the per-row construction that
+        generate_csv_row pays.
+
+        Args:
+            results: List of (filename, AnalysisResult) pairs.
+
+        Returns:
+            DataFrame with one row per result, matching the
+            generate_csv_row column layout.
+        """
+        # Deferred import: only batch CSV export needs pandas
+        import pandas as pd
+
+        columns: Dict[str, list] = {
+            'filename': [name for name, _ in results],
+            'overall_score': [r.overall_score for _, r in results],
+            'grade': [r.grade for _, r in results],
+            'word_count': [r.word_count for _, r in results],
+            'total_issues': [len(r.matches) for _, r in results],
+        }
+
+        # Union of categories across the batch, in first-seen order
+        categories: Dict[str, None] = {}
+        for _, result in results:
+            for category in result.category_scores:
+                categories.setdefault(category)
+
+        for category in categories:
+            scores = []
+            issues = []
+            for _, result in results:
+                cat_score = result.category_scores.get(category)
+                scores.append(cat_score.score if cat_score else float('nan'))
+                issues.append(cat_score.issues_count if cat_score else 0)
+            columns[f"{category}_score"] = scores
+            columns[f"{category}_issues"] = issues
+
+        severity_columns = {
+            s: [0] * len(results) for s in ('critical', 'high', 'medium', 'low')
+        }
+        for idx, (_, result) in enumerate(results):
+            for m in result.matches:
+                severity_columns[m.severity][idx] += m.count
+        for severity, counts in severity_columns.items():
+            columns[f"{severity}_count"] = counts
+
+        return pd.DataFrame(columns)
     
     @staticmethod
-    def generate_markdown_report(result: AnalysisResult) -> str:
+    def generate_markdown_report(
+        result: AnalysisResult,
+        now: Optional[str] = None,
+    ) -> str:
         """
         Generate a Markdown report.
-        
+
         Args:
             result: Analysis result to report on.
-            
+            now: Pre-formatted timestamp for the footer, shared across
+                a batch if supplied.
+
         Returns:
             Markdown formatted string.
         """
@@ -264,12 +358,16 @@ class ReportGenerator:
         if result.matches:
             lines.append("## Issues Detected\n")
             
-            severity_order = ['critical', 'high', 'medium', 'low']
-            for severity in severity_order:
-                matches_by_sev = [m for m in result.matches if m.severity == severity]
+            # Group by severity in a single pass over the matches
+            by_sev: Dict[str, List[MatchResult]] = {}
+            for m in result.matches:
+                by_sev.setdefault(m.severity, []).append(m)
+
+            for severity in ('critical', 'high', 'medium', 'low'):
+                matches_by_sev = by_sev.get(severity)
                 if not matches_by_sev:
                     continue
-                
+
                 lines.append(f"### {severity.upper()} Severity\n")
                 
                 for match in matches_by_sev:
@@ -295,6 +393,8 @@ class ReportGenerator:
             lines.append("")
         
         # Footer
-        lines.append(f"\n---\n*Report generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
+        if now is None:
+            now = datetime.now().strftime(_TS_FMT)
+        lines.append(f"\n---\n*Report generated: {now}*")
         
         return "\n".join(lines)
@@ -3,12 +3,62 @@ Scoring logic for bias analysis.
 """
 
 import math
+from functools import lru_cache
 from typing import List, Dict, Optional
-from collections import defaultdict
+
+import numpy as np
 
 from .models import MatchResult, CategoryScore
 from .loaders import ConfigLoader
 
+try:
+    import ahocorasick
+    _HAS_AHOCORASICK = True
+except ImportError:
+    _HAS_AHOCORASICK = False
+
+
+# Severity ranking and default weight tables, built once at import time
+# instead of per scoring call
+_SEVERITY_ORDER = {'low': 0, 'medium': 1, 'high': 2, 'critical': 3}
+
+_DEFAULT_SEV_WEIGHTS = {
+    'critical': 2.0,
+    'high': 1.5,
+    'medium': 1.0,
+    'low': 0.5,
+}
+
+_DEFAULT_CAT_WEIGHTS = {
+    'gender-coded': 0.25,
+    'ageist': 0.25,
+    'ableist': 0.25,
+    'culture-fit': 0.15,
+    'socioeconomic': 0.05,
+    'racial': 0.05,
+}
+
+
+@lru_cache(maxsize=8)
+def _indicator_automaton(indicators: tuple) -> 'ahocorasick.Automaton':
+    """
+    Build (and cache) an Aho-Corasick automaton over indicator phrases.
+
+    Cached by the indicator tuple so the default list and any
+    config-supplied list each pay construction cost once per process.
+
+    Args:
+        indicators: Tuple of indicator phrases.
+
+    Returns:
+        Automaton whose values are indices into the tuple.
+    """
+    automaton = ahocorasick.Automaton()
+    for idx, indicator in enumerate(indicators):
+        automaton.add_word(indicator.lower(), idx)
+    automaton.make_automaton()
+    return automaton
+
 
 def get_severity_weight(severity: str, config: Optional[ConfigLoader] = None) -> float:
     """
@@ -25,15 +75,8 @@ def get_severity_weight(severity: str, config: Optional[ConfigLoader] = None) ->
         weight = config.get(f'severity_multipliers.{severity}')
         if weight is not None:
             return float(weight)
-    
-    # Default weights
-    default_weights = {
-        'critical': 2.0,
-        'high': 1.5,
-        'medium': 1.0,
-        'low': 0.5,
-    }
-    return default_weights.get(severity, 1.0)
+
+    return _DEFAULT_SEV_WEIGHTS.get(severity, 1.0)
 
 
 def get_category_weight(category: str, config: Optional[ConfigLoader] = None) -> float:
@@ -51,17 +94,8 @@ def get_category_weight(category: str, config: Optional[ConfigLoader] = None) ->
         weight = config.get(f'category_weights.{category}')
         if weight is not None:
             return float(weight)
-    
-    # Default weights
-    default_weights = {
-        'gender-coded': 0.25,
-        'ageist': 0.25,
-        'ableist': 0.25,
-        'culture-fit': 0.15,
-        'socioeconomic': 0.05,
-        'racial': 0.05,
-    }
-    return default_weights.get(category, 0.10)
+
+    return _DEFAULT_CAT_WEIGHTS.get(category, 0.10)
 
 
 def compute_category_scores(
@@ -78,50 +112,63 @@ def compute_category_scores(
     Returns:
         Dictionary mapping category names to CategoryScore objects.
     """
-    category_data = defaultdict(lambda: {
-        'issues': 0,
-        'raw_score': 0.0,
-        'max_severity': 'low'
-    })
-    
-    severity_order = {'low': 0, 'medium': 1, 'high': 2, 'critical': 3}
-    
+    # Per-category accumulator: [issues, raw_score, max_severity].
+    # A plain dict of small lists beats a lambda-defaulted defaultdict
+    # of dicts — no factory call per new category, and positional
+    # indexing in the hot loop instead of string-keyed access.
+    category_data: Dict[str, list] = {}
+
+    severity_order = _SEVERITY_ORDER
+
+    # Resolve each severity weight once instead of per match
+    severity_weights = {
+        s: get_severity_weight(s, config) for s in severity_order
+    }
+
     for match in matches:
-        cat_data = category_data[match.category]
-        cat_data['issues'] += match.count
-        
-        # Accumulate raw score
-        sev_weight = get_severity_weight(match.severity, config)
-        cat_data['raw_score'] += match.count * sev_weight
-        
+        cat_data = category_data.get(match.category)
+        if cat_data is None:
+            cat_data = category_data[match.category] = [0, 0.0, 'low']
+        cat_data[0] += match.count
+
+        # Accumulate raw score. Resolve severities missing from the
+        # precomputed table lazily — .get with a call in the default
+        # argument would run the config lookup on every match.
+        sev_weight = severity_weights.get(match.severity)
+        if sev_weight is None:
+            sev_weight = severity_weights[match.severity] = (
+                get_severity_weight(match.severity, config)
+            )
+        cat_data[1] += match.count * sev_weight
+
         # Track maximum severity
-        if severity_order.get(match.severity, 0) > severity_order.get(cat_data['max_severity'], 0):
-            cat_data['max_severity'] = match.severity
-    
+        if severity_order.get(match.severity, 0) > severity_order.get(cat_data[2], 0):
+            cat_data[2] = match.severity
+
     # Convert to CategoryScore objects with normalized scores
     result = {}
-    for category, data in category_data.items():
+    for category, (issues, raw, max_severity) in category_data.items():
         # Normalize to 0-100 scale (lower is worse)
         # More issues = lower score
-        raw = data['raw_score']
         # Use log scaling to prevent extreme penalties
         penalty = min(50, raw * 10)
         score = max(0, 100 - penalty)
-        
+
         result[category] = CategoryScore(
             category=category,
             score=round(score, 1),
-            issues_count=data['issues'],
-            max_severity=data['max_severity']
+            issues_count=issues,
+            max_severity=max_severity
         )
-    
+
     return result
 
 
 def compute_bias_score(
     matches: List[MatchResult],
     text: str,
-    config: Optional[ConfigLoader] = None
+    config: Optional[ConfigLoader] = None,
+    word_count: Optional[int] = None
 ) -> float:
     """
     Compute overall bias score (0-100, higher is better).
@@ -135,45 +182,125 @@ def compute_bias_score(
         matches: List of bias term matches.
         text: Full analysed text. Used for length normalization.
         config: Optional config loader for custom weights.
+        word_count: Pre-computed word count of the text; callers that
+            already counted words pass it to skip a second split.
         
     Returns:
         Bias score from 0-100 (100 = no bias detected).
     """
     if not matches:
         return 100.0
-    
+
+    total_penalty = _normalized_penalty(matches, text, config, word_count)
+
+    # Convert penalty to 0-100 score (lower penalty = higher score)
+    # Use logarithmic scaling to avoid extreme scores
+    if total_penalty > 0:
+        scaled_penalty = min(100, 20 * math.log(total_penalty + 1))
+    else:
+        scaled_penalty = 0
+
+    score = max(0, 100 - scaled_penalty)
+    return round(score, 1)
+
+
+def _normalized_penalty(
+    matches: List[MatchResult],
+    text: str,
+    config: Optional[ConfigLoader] = None,
+    word_count: Optional[int] = None
+) -> float:
+    """
+    Compute the length-normalized penalty for one ad's matches.
+
+    Shared by the scalar and batch scoring paths; the log scaling that
+    maps the penalty onto 0-100 happens in the callers.
+
+    Args:
+        matches: List of bias term matches.
+        text: Full analysed text. Used for length normalization.
+        config: Optional config loader for custom weights.
+        word_count: Pre-computed word count, or None to count here.
+
+    Returns:
+        Total penalty points after length normalization.
+    """
     # Calculate word count (approximate)
-    word_count = max(1, len(text.split()))
-    
+    if word_count is None:
+        word_count = len(text.split())
+    word_count = max(1, word_count)
+
     # Get normalization factor from config
     norm_factor = 100  # default: 100 words = standard job ad
     if config:
         norm_factor = config.get('scoring.normalization_factor', norm_factor)
-    
+
     # Calculate raw penalty points
-    total_penalty = 0.0
     base_points = 10 if not config else config.get('scoring.base_points_per_issue', 10)
-    
-    for match in matches:
-        cat_weight = get_category_weight(match.category, config)
-        sev_weight = get_severity_weight(match.severity, config)
-        match_penalty = match.count * base_points * cat_weight * sev_weight
-        total_penalty += match_penalty
-    
+
+    # Resolve each distinct weight once up front, then reduce the
+    # count × weight products as NumPy arrays instead of a Python loop
+    category_weights = {
+        c: get_category_weight(c, config)
+        for c in {m.category for m in matches}
+    }
+    severity_weights = {
+        s: get_severity_weight(s, config)
+        for s in {m.severity for m in matches}
+    }
+
+    n = len(matches)
+    counts = np.fromiter((m.count for m in matches), dtype=np.float64, count=n)
+    cat_ws = np.fromiter(
+        (category_weights[m.category] for m in matches),
+        dtype=np.float64, count=n,
+    )
+    sev_ws = np.fromiter(
+        (severity_weights[m.severity] for m in matches),
+        dtype=np.float64, count=n,
+    )
+    total_penalty = float((counts * cat_ws * sev_ws).sum()) * base_points
+
     # Normalize by text length
     if config and config.get('scoring.length_normalization', True):
         length_factor = max(0.5, min(2.0, word_count / norm_factor))
         total_penalty = total_penalty / length_factor
-    
-    # Convert penalty to 0-100 score (lower penalty = higher score)
-    # Use logarithmic scaling to avoid extreme scores
-    if total_penalty > 0:
-        scaled_penalty = min(100, 20 * math.log(total_penalty + 1))
-    else:
-        scaled_penalty = 0
-    
-    score = max(0, 100 - scaled_penalty)
-    return round(score, 1)
+
+    return total_penalty
+
+
+def compute_bias_scores_batch(
+    all_matches: List[List[MatchResult]],
+    texts: List[str],
+    config: Optional[ConfigLoader] = None
+) -> 'np.ndarray':
+    """
+    Score a batch of ads in one vectorized pass.
+
+    Penalties accumulate into a single array and the log scaling runs
+    as one np.log1p call instead of a math.log per ad.
+
+    Args:
+        all_matches: Per-ad match lists, aligned with texts.
+        texts: The analysed ad texts.
+        config: Optional config loader for custom weights.
+
+    Returns:
+        Array of bias scores (0-100) rounded to one decimal, in order.
+    """
+    penalties = np.fromiter(
+        (
+            _normalized_penalty(matches, text, config) if matches else -1.0
+            for matches, text in zip(all_matches, texts)
+        ),
+        dtype=np.float64, count=len(texts),
+    )
+
+    scaled = np.minimum(100, 20 * np.log1p(np.maximum(penalties, 0.0)))
+    scores = np.maximum(0, 100 - scaled).round(1)
+    # Ads with no matches score a flat 100
+    scores[penalties < 0] = 100.0
+    return scores
 
 
 def get_grade(score: float) -> str:
@@ -196,14 +323,20 @@ def get_grade(score: float) -> str:
         return "Poor"
 
 
-def detect_positive_indicators(text: str, config: Optional[ConfigLoader] = None) -> List[str]:
+def detect_positive_indicators(
+    text: str,
+    config: Optional[ConfigLoader] = None,
+    text_lower: Optional[str] = None,
+) -> List[str]:
     """
     Detect positive inclusive language indicators in text.
-    
+
     Args:
         text: Job ad text.
         config: Optional config loader.
-        
+        text_lower: Pre-lowercased copy of text, if the caller already
+            has one; saves re-folding large ads at every pipeline stage.
+
     Returns:
         List of detected positive indicators.
     """
@@ -227,13 +360,21 @@ def detect_positive_indicators(text: str, config: Optional[ConfigLoader] = None)
         if config_indicators:
             indicators = config_indicators
     
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
+
+    # One automaton pass over the text finds every indicator at once
+    # instead of M separate substring scans
+    if _HAS_AHOCORASICK:
+        automaton = _indicator_automaton(tuple(indicators))
+        found_idx = {idx for _, idx in automaton.iter(text_lower)}
+        return [indicators[i] for i in sorted(found_idx)]
+
     found = []
-    
     for indicator in indicators:
         if indicator.lower() in text_lower:
             found.append(indicator)
-    
+
     return found
 
 
@@ -257,21 +398,27 @@ def generate_recommendations(
         recommendations.append("✓ No biased language detected - great job!")
         return recommendations
     
-    # Priority recommendations by severity
-    critical_matches = [m for m in matches if m.severity == 'critical']
-    high_matches = [m for m in matches if m.severity == 'high']
-    
-    if critical_matches:
-        count = sum(m.count for m in critical_matches)
+    # Tally severity counts and the overall total in one pass over the
+    # matches instead of filtering the list per severity level
+    critical_count = 0
+    high_count = 0
+    total_issues = 0
+    for m in matches:
+        total_issues += m.count
+        if m.severity == 'critical':
+            critical_count += m.count
+        elif m.severity == 'high':
+            high_count += m.count
+    
+    if critical_count:
         recommendations.append(
-            f"🔴 CRITICAL: Remove {count} critically biased term(s) immediately - "
+            f"🔴 CRITICAL: Remove {critical_count} critically biased term(s) immediately - "
             "these may violate employment law"
         )
     
-    if high_matches:
-        count = sum(m.count for m in high_matches)
+    if high_count:
         recommendations.append(
-            f"⚠️  HIGH PRIORITY: Replace {count} strongly biased term(s) with "
+            f"⚠️  HIGH PRIORITY: Replace {high_count} strongly biased term(s) with "
             "neutral alternatives"
         )
     
@@ -292,7 +439,6 @@ def generate_recommendations(
             )
     
     # General advice
-    total_issues = sum(m.count for m in matches)
     if total_issues <= 3:
         recommendations.append(
             "💡 You're close! Fix these few issues for an excellent score"
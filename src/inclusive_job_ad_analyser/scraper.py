@@ -2,17 +2,114 @@
 Web scraping utilities for extracting job ads from URLs.
 """
 
-from typing import Optional, Dict, Any
-from urllib.parse import urlparse
+from typing import Optional, Dict, Any, Iterator
+from urllib.parse import urlparse, urlsplit, urlunsplit
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from hashlib import blake2b
+import asyncio
 import re
+import threading
 
 try:
     import requests
-    from bs4 import BeautifulSoup
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from bs4 import BeautifulSoup, SoupStrainer
     _HAS_SCRAPING = True
 except ImportError:
     _HAS_SCRAPING = False
 
+try:
+    import httpx
+    _HAS_HTTPX = True
+except ImportError:
+    _HAS_HTTPX = False
+
+try:
+    # C-backed parser, several times faster than html.parser on real pages
+    import lxml  # noqa: F401
+    _SOUP_PARSER = 'lxml'
+except ImportError:
+    _SOUP_PARSER = 'html.parser'
+
+try:
+    # Only advertise brotli when urllib3 can actually decode it
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
+
+# Patterns used by the generic parser and the search scrapers, compiled
+# once at import instead of per call
+_WS_COLLAPSE_RE = re.compile(r'\n{3,}')
+_DIGITS_RE = re.compile(r'\d+')
+_GENERIC_DESC_RES = [
+    re.compile(hint, re.I)
+    for hint in ('job-description', 'description', 'content', 'job-details')
+]
+_INDEED_CARD_RE = re.compile('job_seen_beacon', re.I)
+_INDEED_TITLE_RE = re.compile('jcs-JobTitle', re.I)
+_LINKEDIN_CARD_RE = re.compile('base-card', re.I)
+_LINKEDIN_LINK_RE = re.compile('base-card__full-link', re.I)
+_LINKEDIN_TITLE_RE = re.compile('base-search-card__title', re.I)
+_LINKEDIN_SUBTITLE_RE = re.compile('base-search-card__subtitle', re.I)
+_GLASSDOOR_CARD_RE = re.compile('react-job-listing', re.I)
+_GLASSDOOR_LINK_RE = re.compile('job-search-key', re.I)
+
+# CSS selectors used by the site extractors. Using constant strings
+# lets soupsieve reuse its compiled selector for every page; fallbacks
+# stay as separate select_one calls because a comma-joined selector
+# returns the document-order first match, not the preferred one.
+_LI_TITLE_SEL = 'h1.top-card-layout__title'
+_LI_COMPANY_SEL = 'a.topcard__org-name-link'
+_LI_COMPANY_FALLBACK_SEL = 'span.topcard__flavor'
+_LI_DESC_SEL = 'div.show-more-less-html__markup'
+_LI_DESC_FALLBACK_SEL = 'div.description__text'
+_INDEED_TITLE_SEL = 'h1.jobsearch-JobInfoHeader-title'
+_INDEED_COMPANY_SEL = 'div[data-company-name]'
+_INDEED_COMPANY_FALLBACK_SEL = 'div.jobsearch-InlineCompanyRating'
+_INDEED_DESC_SEL = 'div#jobDescriptionText'
+_INDEED_DESC_FALLBACK_SEL = 'div.jobsearch-jobDescriptionText'
+_GD_TITLE_SEL = 'div[data-test="job-title"]'
+_GD_COMPANY_SEL = 'div[data-test="employer-name"]'
+_GD_DESC_SEL = 'div.jobDescriptionContent'
+_GD_DESC_FALLBACK_SEL = 'div[data-test="job-description"]'
+
+
+# Every node the LinkedIn extractor reads is selected by class, so a
+# strainer can skip materializing the rest of the page at parse time.
+# The Indeed/Glassdoor/generic extractors mix bare-tag fallbacks
+# (soup.find('h1')) with id/data-attribute selectors, which a single
+# SoupStrainer can't express, so those pages get full parses.
+_LINKEDIN_STRAINER = SoupStrainer(
+    class_=re.compile(
+        r'top-card-layout__title|topcard__org-name-link|topcard__flavor'
+        r'|show-more-less-html__markup|description__text'
+    )
+) if _HAS_SCRAPING else None
+
+
+
+def _dedupe_urls(urls: list) -> list:
+    """
+    Drop repeated URLs while preserving first-seen order.
+
+    URLs are compared with the fragment stripped, so tracking variants
+    like page#apply and page collapse to one fetch.
+    """
+    seen = set()
+    unique = []
+    for url in urls:
+        parts = urlsplit(url)
+        key = urlunsplit((parts.scheme, parts.netloc, parts.path, parts.query, ''))
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(url)
+    return unique
+
 
 class JobAdScraper:
     """
@@ -40,62 +137,142 @@ class JobAdScraper:
         
         self.timeout = timeout
         self.session = requests.Session()
+        # Raise the connection pool above urllib3's default and retry
+        # transient failures with backoff: search_jobs fetches many pages
+        # from the same host, so keep-alive reuse skips the TCP/TLS
+        # handshake on every request after the first.
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Advertise compressed transfer: job boards serve HTML that
+        # shrinks several-fold under gzip/brotli, and requests decodes
+        # transparently. br is included only when the optional brotli
+        # package is importable.
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
                          'AppleWebKit/537.36 (KHTML, like Gecko) '
-                         'Chrome/120.0.0.0 Safari/537.36'
+                         'Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;'
+                      'q=0.9,*/*;q=0.8',
+            'Accept-Encoding': _ACCEPT_ENCODING,
+            'Accept-Language': 'en-US,en;q=0.9',
         })
-    
+
+        # LRU cache of scrape results: the same job URL often shows up
+        # across search boards and repeated runs, and the result dicts
+        # derive purely from the page content. Guarded by a lock because
+        # scrape() runs on this class's own thread pools, where an
+        # unlocked move_to_end can race an evicting insert.
+        self._url_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._url_cache_size = 512
+        self._url_cache_lock = threading.Lock()
+
     def scrape(self, url: str) -> Dict[str, Any]:
         """
         Scrape job ad from URL.
-        
+
         Args:
             url: URL of the job posting.
-            
+
         Returns:
             Dictionary with 'text', 'title', 'company', 'url', 'source'.
         """
+        with self._url_cache_lock:
+            cached = self._url_cache.get(url)
+            if cached is not None:
+                self._url_cache.move_to_end(url)
+                return cached
+
+        result = self._parse_job_page(url, self._fetch_html(url))
+
+        with self._url_cache_lock:
+            self._url_cache[url] = result
+            if len(self._url_cache) > self._url_cache_size:
+                self._url_cache.popitem(last=False)
+        return result
+
+    def _parse_job_page(self, url: str, html: bytes) -> Dict[str, Any]:
+        """Dispatch fetched HTML to the extractor for the URL's job board."""
         parsed = urlparse(url)
         domain = parsed.netloc.lower()
-        
+
         # Determine source and use appropriate extractor
         if 'linkedin.com' in domain:
-            return self._scrape_linkedin(url)
-        elif 'indeed.com' in domain:
-            return self._scrape_indeed(url)
+            soup = BeautifulSoup(html, _SOUP_PARSER, parse_only=_LINKEDIN_STRAINER)
+            return self._parse_linkedin(soup, url)
+
+        soup = BeautifulSoup(html, _SOUP_PARSER)
+        if 'indeed.com' in domain:
+            return self._parse_indeed(soup, url)
         elif 'glassdoor.com' in domain:
-            return self._scrape_glassdoor(url)
+            return self._parse_glassdoor(soup, url)
         else:
-            return self._scrape_generic(url)
-    
-    def _fetch_page(self, url: str) -> BeautifulSoup:
-        """Fetch and parse HTML page."""
+            return self._parse_generic(soup, url)
+
+    # Cap on fetched page size; job postings are far smaller, so anything
+    # beyond this is boilerplate the extractors never read
+    _MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+    def _fetch_html(self, url: str) -> bytes:
+        """
+        Fetch raw HTML bytes for a URL, streaming at most 2 MiB.
+
+        Non-HTML responses are rejected before any body is read, and
+        oversized pages are truncated rather than buffered wholesale, so
+        a stray PDF or multi-megabyte page can't balloon memory. The
+        body is returned undecoded: response.text runs a Python-level
+        charset probe when the header omits an encoding, while lxml
+        detects the encoding itself in C during parsing.
+        """
         try:
-            response = self.session.get(url, timeout=self.timeout)
+            response = self.session.get(
+                url, timeout=self.timeout, stream=True
+            )
             response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
+
+            content_type = response.headers.get('Content-Type', '')
+            if content_type and 'html' not in content_type:
+                response.close()
+                raise ValueError(
+                    f"Failed to fetch URL: non-HTML content ({content_type})"
+                )
+
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(65536):
+                total += len(chunk)
+                if total > self._MAX_PAGE_BYTES:
+                    break
+                chunks.append(chunk)
+            response.close()
+            return b''.join(chunks)
         except requests.RequestException as e:
             raise ValueError(f"Failed to fetch URL: {e}")
-    
-    def _scrape_linkedin(self, url: str) -> Dict[str, Any]:
+
+    def _parse_linkedin(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
         """Extract job ad from LinkedIn."""
-        soup = self._fetch_page(url)
-        
         # Extract title
-        title_elem = soup.find('h1', class_='top-card-layout__title')
+        title_elem = soup.select_one(_LI_TITLE_SEL)
         title = title_elem.get_text(strip=True) if title_elem else "Unknown Position"
         
         # Extract company
-        company_elem = soup.find('a', class_='topcard__org-name-link')
+        company_elem = soup.select_one(_LI_COMPANY_SEL)
         if not company_elem:
-            company_elem = soup.find('span', class_='topcard__flavor')
+            company_elem = soup.select_one(_LI_COMPANY_FALLBACK_SEL)
         company = company_elem.get_text(strip=True) if company_elem else "Unknown Company"
         
         # Extract description
-        desc_elem = soup.find('div', class_='show-more-less-html__markup')
+        desc_elem = soup.select_one(_LI_DESC_SEL)
         if not desc_elem:
-            desc_elem = soup.find('div', class_='description__text')
+            desc_elem = soup.select_one(_LI_DESC_FALLBACK_SEL)
         
         text = desc_elem.get_text('\n', strip=True) if desc_elem else ""
         
@@ -107,26 +284,24 @@ class JobAdScraper:
             'source': 'LinkedIn'
         }
     
-    def _scrape_indeed(self, url: str) -> Dict[str, Any]:
+    def _parse_indeed(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
         """Extract job ad from Indeed."""
-        soup = self._fetch_page(url)
-        
         # Extract title
-        title_elem = soup.find('h1', class_='jobsearch-JobInfoHeader-title')
+        title_elem = soup.select_one(_INDEED_TITLE_SEL)
         if not title_elem:
             title_elem = soup.find('h1')
         title = title_elem.get_text(strip=True) if title_elem else "Unknown Position"
         
         # Extract company
-        company_elem = soup.find('div', {'data-company-name': True})
+        company_elem = soup.select_one(_INDEED_COMPANY_SEL)
         if not company_elem:
-            company_elem = soup.find('div', class_='jobsearch-InlineCompanyRating')
+            company_elem = soup.select_one(_INDEED_COMPANY_FALLBACK_SEL)
         company = company_elem.get_text(strip=True) if company_elem else "Unknown Company"
         
         # Extract description
-        desc_elem = soup.find('div', id='jobDescriptionText')
+        desc_elem = soup.select_one(_INDEED_DESC_SEL)
         if not desc_elem:
-            desc_elem = soup.find('div', class_='jobsearch-jobDescriptionText')
+            desc_elem = soup.select_one(_INDEED_DESC_FALLBACK_SEL)
         
         text = desc_elem.get_text('\n', strip=True) if desc_elem else ""
         
@@ -138,24 +313,22 @@ class JobAdScraper:
             'source': 'Indeed'
         }
     
-    def _scrape_glassdoor(self, url: str) -> Dict[str, Any]:
+    def _parse_glassdoor(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
         """Extract job ad from Glassdoor."""
-        soup = self._fetch_page(url)
-        
         # Extract title
-        title_elem = soup.find('div', {'data-test': 'job-title'})
+        title_elem = soup.select_one(_GD_TITLE_SEL)
         if not title_elem:
             title_elem = soup.find('h1')
         title = title_elem.get_text(strip=True) if title_elem else "Unknown Position"
         
         # Extract company
-        company_elem = soup.find('div', {'data-test': 'employer-name'})
+        company_elem = soup.select_one(_GD_COMPANY_SEL)
         company = company_elem.get_text(strip=True) if company_elem else "Unknown Company"
         
         # Extract description
-        desc_elem = soup.find('div', class_='jobDescriptionContent')
+        desc_elem = soup.select_one(_GD_DESC_SEL)
         if not desc_elem:
-            desc_elem = soup.find('div', {'data-test': 'job-description'})
+            desc_elem = soup.select_one(_GD_DESC_FALLBACK_SEL)
         
         text = desc_elem.get_text('\n', strip=True) if desc_elem else ""
         
@@ -167,14 +340,12 @@ class JobAdScraper:
             'source': 'Glassdoor'
         }
     
-    def _scrape_generic(self, url: str) -> Dict[str, Any]:
+    def _parse_generic(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
         """
         Extract job ad from generic website.
-        
+
         Uses heuristics to find job description content.
         """
-        soup = self._fetch_page(url)
-        
         # Try to find title
         title = "Unknown Position"
         for tag in ['h1', 'h2']:
@@ -183,21 +354,28 @@ class JobAdScraper:
                 title = title_elem.get_text(strip=True)
                 break
         
-        # Try to find company
+        # Try to find company. A plain substring test over a bounded
+        # number of text nodes beats regex-matching every string in the
+        # document, and 200 nodes is well past the page header where a
+        # company mention would appear.
         company = "Unknown Company"
-        company_elem = soup.find(text=re.compile(r'company', re.I))
-        if company_elem:
-            company = company_elem.strip()
+        for s in soup.find_all(string=True, limit=200):
+            if 'company' in s.lower():
+                company = s.strip()
+                break
         
         # Extract main content
-        # Remove script, style, nav, footer
+        # Detach script, style, nav, footer before pulling text. extract()
+        # just unlinks the subtree, skipping decompose()'s recursive
+        # clearing of every descendant; the soup is discarded after this
+        # call so the freed-memory benefit of decompose is moot.
         for tag in soup(['script', 'style', 'nav', 'footer', 'header']):
-            tag.decompose()
+            tag.extract()
         
         # Try common job description containers
         desc_elem = None
-        for class_hint in ['job-description', 'description', 'content', 'job-details']:
-            desc_elem = soup.find('div', class_=re.compile(class_hint, re.I))
+        for class_re in _GENERIC_DESC_RES:
+            desc_elem = soup.find('div', class_=class_re)
             if desc_elem:
                 break
         
@@ -208,7 +386,7 @@ class JobAdScraper:
         text = desc_elem.get_text('\n', strip=True) if desc_elem else ""
         
         # Clean up excessive whitespace
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _WS_COLLAPSE_RE.sub('\n\n', text)
         
         return {
             'text': text,
@@ -218,32 +396,251 @@ class JobAdScraper:
             'source': 'Generic'
         }
     
+    @staticmethod
+    def _error_result(url: str, error: Exception) -> Dict[str, Any]:
+        """Build the placeholder dict returned for a failed scrape."""
+        return {
+            'text': '',
+            'title': 'Error',
+            'company': 'Error',
+            'url': url,
+            'source': 'Error',
+            'error': str(error)
+        }
+
     def scrape_multiple(self, urls: list[str]) -> list[Dict[str, Any]]:
         """
-        Scrape multiple URLs.
-        
+        Scrape multiple URLs concurrently over the shared requests session.
+
+        Fetches fan out over a thread pool (requests sessions are safe
+        for concurrent GETs), while results keep input order and failed
+        scrapes keep their placeholder entries.
+
         Args:
             urls: List of job posting URLs.
-            
+
         Returns:
-            List of scraped job ad dictionaries.
+            List of scraped job ad dictionaries, in input order.
         """
+        urls = _dedupe_urls(urls)
+        if not urls:
+            return []
+
         results = []
-        for url in urls:
-            try:
-                result = self.scrape(url)
-                results.append(result)
-            except Exception as e:
-                results.append({
-                    'text': '',
-                    'title': 'Error',
-                    'company': 'Error',
-                    'url': url,
-                    'source': 'Error',
-                    'error': str(e)
-                })
+        with ThreadPoolExecutor(max_workers=min(16, len(urls))) as executor:
+            futures = [executor.submit(self.scrape, url) for url in urls]
+            for url, future in zip(urls, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(self._error_result(url, e))
         return results
+
+    def scrape_multiple_concurrent(
+        self,
+        urls: list[str],
+        concurrency: int = 16
+    ) -> list[Dict[str, Any]]:
+        """
+        Scrape multiple URLs, concurrently when httpx is installed.
+
+        Concurrent fetching bounds wall time by the slowest request
+        rather than the sum of all round trips; without httpx this falls
+        back to the serial requests path.
+
+        Args:
+            urls: List of job posting URLs.
+            concurrency: Maximum number of in-flight requests.
+
+        Returns:
+            List of scraped job ad dictionaries, in input order.
+        """
+        if _HAS_HTTPX and urls:
+            return asyncio.run(self.scrape_multiple_async(urls, concurrency))
+        return self.scrape_multiple(urls)
+
+    def iter_scrape_multiple(
+        self,
+        urls: list[str],
+        max_workers: int = 8
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Scrape multiple URLs, yielding each result as it completes.
+
+        Unlike scrape_multiple, results arrive in completion order, so
+        downstream work (analysis, reporting) can start on the first
+        finished page while the rest are still downloading.
+
+        Args:
+            urls: List of job posting URLs.
+            max_workers: Maximum number of concurrent fetch threads.
+
+        Yields:
+            Scraped job ad dictionaries, in completion order.
+        """
+        urls = _dedupe_urls(urls)
+        if not urls:
+            return
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            future_urls = {
+                executor.submit(self.scrape, url): url for url in urls
+            }
+            for future in as_completed(future_urls):
+                try:
+                    yield future.result()
+                except Exception as e:
+                    yield self._error_result(future_urls[future], e)
+
+    def scrape_and_analyse_multiple(
+        self,
+        urls: list[str],
+        analyser,
+        batch_size: int = 8
+    ) -> list[tuple[Dict[str, Any], list]]:
+        """
+        Scrape multiple URLs and analyse them in one batched pass.
+
+        Running every scraped text through analyse_many shares a single
+        spaCy pipeline pass across the batch instead of paying per-call
+        pipeline setup for each ad.
+
+        Args:
+            urls: List of job posting URLs.
+            analyser: JobAdAnalyser used to analyse the scraped text.
+            batch_size: spaCy pipe batch size for the analysis pass.
+
+        Returns:
+            List of (job_data, matches) pairs in input order; failed
+            scrapes pair with an empty match list.
+        """
+        results = self.scrape_multiple_concurrent(urls)
+        texts = [r.get('text', '') for r in results]
+        all_matches = analyser.analyse_many(texts, batch_size=batch_size)
+        return list(zip(results, all_matches))
+
+    async def scrape_multiple_async(
+        self,
+        urls: list[str],
+        concurrency: int = 16
+    ) -> list[Dict[str, Any]]:
+        """
+        Scrape multiple URLs concurrently over an async HTTP client.
+
+        Args:
+            urls: List of job posting URLs.
+            concurrency: Maximum number of in-flight requests.
+
+        Returns:
+            List of scraped job ad dictionaries, in input order.
+        """
+        urls = _dedupe_urls(urls)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with httpx.AsyncClient(
+            headers=dict(self.session.headers),
+            timeout=self.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=concurrency,
+                max_keepalive_connections=concurrency,
+            ),
+        ) as client:
+            async def scrape_one(url: str) -> Dict[str, Any]:
+                async with semaphore:
+                    try:
+                        # Same guards as _fetch_html: reject non-HTML
+                        # before reading the body and cap the bytes kept
+                        async with client.stream('GET', url) as response:
+                            response.raise_for_status()
+                            content_type = response.headers.get(
+                                'Content-Type', ''
+                            )
+                            if content_type and 'html' not in content_type:
+                                raise ValueError(
+                                    "Failed to fetch URL: non-HTML content "
+                                    f"({content_type})"
+                                )
+                            chunks = []
+                            total = 0
+                            async for chunk in response.aiter_bytes(65536):
+                                total += len(chunk)
+                                if total > self._MAX_PAGE_BYTES:
+                                    break
+                                chunks.append(chunk)
+                        return self._parse_job_page(url, b''.join(chunks))
+                    except Exception as e:
+                        return self._error_result(url, e)
+
+            return list(await asyncio.gather(*(scrape_one(u) for u in urls)))
     
+    @staticmethod
+    def _content_digest(text: str) -> str:
+        """
+        Digest job-ad text for near-duplicate detection.
+
+        Digits are stripped first so reposts differing only in IDs,
+        dates or salary figures hash identically.
+        """
+        normalized = _DIGITS_RE.sub('', text[:4000])
+        return blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _is_duplicate_content(
+        self,
+        job_data: Dict[str, Any],
+        seen_digests: set,
+    ) -> bool:
+        """
+        Record a scraped job's content digest, reporting repeats.
+
+        Jobs with no extracted text are never treated as duplicates:
+        failed extractions all digest identically, and dropping them
+        would silently discard every selector-miss page after the first.
+        """
+        text = job_data.get('text') or ''
+        if not text:
+            return False
+        digest = self._content_digest(text)
+        if digest in seen_digests:
+            return True
+        seen_digests.add(digest)
+        return False
+
+    def _scrape_job_urls(self, job_urls: list[str]) -> list[Dict[str, Any]]:
+        """
+        Scrape a batch of search-result URLs over a thread pool.
+
+        The fetches are I/O-bound and the session's adapter pool is
+        sized for concurrent use, so threads turn max_results sequential
+        round trips into one. Failed scrapes are dropped, and content
+        that repeats within this batch (boards repost the same job under
+        different IDs) is deduplicated by digest; the digest set is
+        scoped to the call so one search never hides results from the
+        next. Successful results keep input order.
+
+        Args:
+            job_urls: Job posting URLs collected from search cards.
+
+        Returns:
+            List of scraped job ad dictionaries.
+        """
+        if not job_urls:
+            return []
+
+        job_urls = _dedupe_urls(job_urls)
+        seen_digests: set = set()
+        results = []
+        with ThreadPoolExecutor(max_workers=min(8, len(job_urls))) as executor:
+            futures = [executor.submit(self.scrape, url) for url in job_urls]
+            for future in futures:
+                try:
+                    job_data = future.result()
+                except Exception:
+                    continue
+                if self._is_duplicate_content(job_data, seen_digests):
+                    continue
+                results.append(job_data)
+        return results
+
     def search_jobs(self, query: str, source: str = "indeed", location: str = "", 
                     max_results: int = 10) -> list[Dict[str, Any]]:
         """
@@ -280,41 +677,27 @@ class JobAdScraper:
         try:
             response = self.session.get(base_url, params=params, timeout=self.timeout)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, _SOUP_PARSER)
             
             # Find job cards
-            job_cards = soup.find_all('div', class_=re.compile('job_seen_beacon', re.I), limit=max_results)
+            job_cards = soup.find_all('div', class_=_INDEED_CARD_RE, limit=max_results)
             
-            results = []
+            # Collect job URLs first, then fetch them concurrently
+            job_urls = []
             for card in job_cards:
-                try:
-                    # Extract job link
-                    link_elem = card.find('a', class_=re.compile('jcs-JobTitle', re.I))
-                    if not link_elem:
-                        continue
-                    
-                    job_id = link_elem.get('data-jk', '')
-                    if job_id:
-                        job_url = f"https://www.indeed.com/viewjob?jk={job_id}"
-                    else:
-                        href = link_elem.get('href', '')
-                        job_url = f"https://www.indeed.com{href}" if href.startswith('/') else href
-                    
-                    # Extract title
-                    title = link_elem.get_text(strip=True)
-                    
-                    # Extract company
-                    company_elem = card.find('span', {'data-testid': 'company-name'})
-                    company = company_elem.get_text(strip=True) if company_elem else "Unknown"
-                    
-                    # Scrape full job description
-                    job_data = self.scrape(job_url)
-                    results.append(job_data)
-                    
-                except Exception as e:
+                link_elem = card.find('a', class_=_INDEED_TITLE_RE)
+                if not link_elem:
                     continue
-                    
-            return results[:max_results]
+
+                job_id = link_elem.get('data-jk', '')
+                if job_id:
+                    job_url = f"https://www.indeed.com/viewjob?jk={job_id}"
+                else:
+                    href = link_elem.get('href', '')
+                    job_url = f"https://www.indeed.com{href}" if href.startswith('/') else href
+                job_urls.append(job_url)
+
+            return self._scrape_job_urls(job_urls)[:max_results]
             
         except Exception as e:
             raise ValueError(f"Failed to search Indeed: {str(e)}")
@@ -330,42 +713,27 @@ class JobAdScraper:
         try:
             response = self.session.get(base_url, params=params, timeout=self.timeout)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, _SOUP_PARSER)
             
             # Find job cards (LinkedIn structure)
-            job_cards = soup.find_all('div', class_=re.compile('base-card', re.I), limit=max_results * 2)
+            job_cards = soup.find_all('div', class_=_LINKEDIN_CARD_RE, limit=max_results * 2)
             
-            results = []
+            # Collect job URLs first, then fetch them concurrently
+            job_urls = []
             for card in job_cards:
-                if len(results) >= max_results:
+                if len(job_urls) >= max_results:
                     break
-                    
-                try:
-                    # Extract job link
-                    link_elem = card.find('a', class_=re.compile('base-card__full-link', re.I))
-                    if not link_elem:
-                        continue
-                    
-                    job_url = link_elem.get('href', '').split('?')[0]  # Remove query params
-                    if not job_url.startswith('http'):
-                        continue
-                    
-                    # Extract title
-                    title_elem = card.find('h3', class_=re.compile('base-search-card__title', re.I))
-                    title = title_elem.get_text(strip=True) if title_elem else "Unknown"
-                    
-                    # Extract company
-                    company_elem = card.find('h4', class_=re.compile('base-search-card__subtitle', re.I))
-                    company = company_elem.get_text(strip=True) if company_elem else "Unknown"
-                    
-                    # Scrape full job description
-                    job_data = self.scrape(job_url)
-                    results.append(job_data)
-                    
-                except Exception as e:
+
+                link_elem = card.find('a', class_=_LINKEDIN_LINK_RE)
+                if not link_elem:
                     continue
-            
-            return results
+
+                job_url = link_elem.get('href', '').split('?')[0]  # Remove query params
+                if not job_url.startswith('http'):
+                    continue
+                job_urls.append(job_url)
+
+            return self._scrape_job_urls(job_urls)[:max_results]
             
         except Exception as e:
             raise ValueError(f"Failed to search LinkedIn: {str(e)}")
@@ -382,30 +750,23 @@ class JobAdScraper:
         try:
             response = self.session.get(base_url, params=params, timeout=self.timeout)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, _SOUP_PARSER)
             
             # Find job cards
-            job_cards = soup.find_all('li', class_=re.compile('react-job-listing', re.I), limit=max_results)
+            job_cards = soup.find_all('li', class_=_GLASSDOOR_CARD_RE, limit=max_results)
             
-            results = []
+            # Collect job URLs first, then fetch them concurrently
+            job_urls = []
             for card in job_cards:
-                try:
-                    # Extract job link
-                    link_elem = card.find('a', class_=re.compile('job-search-key', re.I))
-                    if not link_elem:
-                        continue
-                    
-                    href = link_elem.get('href', '')
-                    job_url = f"https://www.glassdoor.com{href}" if href.startswith('/') else href
-                    
-                    # Scrape full job description
-                    job_data = self.scrape(job_url)
-                    results.append(job_data)
-                    
-                except Exception as e:
+                link_elem = card.find('a', class_=_GLASSDOOR_LINK_RE)
+                if not link_elem:
                     continue
-            
-            return results[:max_results]
+
+                href = link_elem.get('href', '')
+                job_url = f"https://www.glassdoor.com{href}" if href.startswith('/') else href
+                job_urls.append(job_url)
+
+            return self._scrape_job_urls(job_urls)[:max_results]
             
         except Exception as e:
             raise ValueError(f"Failed to search Glassdoor: {str(e)}")
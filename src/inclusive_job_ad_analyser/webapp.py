@@ -5,21 +5,28 @@ Run this module directly to start the web interface:
     python -m inclusive_job_ad_analyser.webapp
 """
 
+from __future__ import annotations
+
+import atexit
+import bisect
+import csv
+import io
+import os
 import re
 import json
+import pickle
+import threading
+import sys
 import tempfile
+import time
 from typing import Tuple, List, Optional, Dict, Any
+from collections import OrderedDict
+from hashlib import blake2b
+from html import escape
 from pathlib import Path
 
-try:
-    import gradio as gr
-except ImportError:
-    print("Error: Gradio is not installed.")
-    print("Install it with: pip install gradio")
-    exit(1)
-
 from .analyser import JobAdAnalyser
-from .cli import analyse_text
+from .cli import analyse_text, analyse_texts
 from .loaders import ConfigLoader
 from .reporting import ReportGenerator
 
@@ -31,13 +38,170 @@ except ImportError:
     _HAS_SCRAPING = False
 
 
-# Initialize analyser (global for performance)
-analyser = JobAdAnalyser(use_spacy=True)
-config = ConfigLoader()
-scraper = JobAdScraper() if _HAS_SCRAPING else None
+# Shared singletons, created on first use so importing this module (for
+# its helpers, or during test collection) doesn't pay spaCy and
+# dictionary startup before the first request arrives.
+_analyser: Optional[JobAdAnalyser] = None
+_config: Optional[ConfigLoader] = None
+_scraper = None
 report_generator = ReportGenerator()
 
 
+def get_analyser() -> JobAdAnalyser:
+    """Return the shared analyser, building it on first use."""
+    global _analyser
+    if _analyser is None:
+        _analyser = JobAdAnalyser(use_spacy=True)
+    return _analyser
+
+
+def get_config() -> ConfigLoader:
+    """Return the shared config loader, building it on first use."""
+    global _config
+    if _config is None:
+        _config = ConfigLoader()
+    return _config
+
+
+def get_scraper():
+    """Return the shared scraper, or None when scraping deps are missing."""
+    global _scraper
+    if _scraper is None and _HAS_SCRAPING:
+        _scraper = JobAdScraper()
+    return _scraper
+
+# LRU of analysis results keyed by a digest of the ad text: Gradio
+# re-fires the callback when only display options change (e.g. toggling
+# suggestions), and example clicks repeat identical text. Digest keys
+# keep the cache from pinning full ad texts in memory, and the lock
+# keeps LRU bookkeeping sane under Gradio's concurrent requests.
+_analysis_cache: OrderedDict = OrderedDict()
+_ANALYSIS_CACHE_SIZE = 256
+_analysis_cache_lock = threading.Lock()
+
+# Upload size cap for the file tab; job ads are a few KB, so anything
+# larger is rejected before it can exhaust worker memory
+_MAX_UPLOAD_BYTES = 2 * 1024 * 1024
+
+# On-disk cache of scraped-URL analyses, so re-inspecting the same
+# posting (within or across sessions) skips both the network fetch and
+# the spaCy pass. Entries expire after a day since postings get edited.
+_URL_CACHE_DIR = Path.home() / '.cache' / 'inclusive-job-ad-analyser' / 'urls'
+_URL_CACHE_TTL = 24 * 60 * 60
+
+
+def _url_cache_path(url: str) -> Path:
+    """Return the cache file path for a URL."""
+    digest = blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+    return _URL_CACHE_DIR / f"{digest}.pkl"
+
+
+def _load_url_cache(url: str):
+    """Return the cached entry dict for a URL, or None if absent/stale."""
+    try:
+        with open(_url_cache_path(url), 'rb') as fh:
+            entry = pickle.load(fh)
+        if time.time() - entry['ts'] > _URL_CACHE_TTL:
+            return None
+        return entry
+    except (OSError, pickle.UnpicklingError, AttributeError, EOFError, KeyError):
+        # Missing file, or a cache written before a model layout change;
+        # either way, fall through to a fresh scrape
+        return None
+
+
+def _store_url_cache(url: str, entry: dict) -> None:
+    """Persist a scraped-URL analysis entry; failures are non-fatal."""
+    try:
+        _URL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_url_cache_path(url), 'wb') as fh:
+            pickle.dump(entry, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+# Severity display order for the detailed-issues sections, and the
+# pre-rendered section headers so the render loop does dict lookups only
+_SEVERITY_ORDER = ('critical', 'high', 'medium', 'low')
+_SEV_HEADERS = {s: f"#### {s.upper()} Severity\n\n" for s in _SEVERITY_ORDER}
+
+# Category score tiers for emoji display: below 60, 60-79, 80 and up.
+# bisect against the thresholds picks the emoji without a branch chain,
+# and extending the tiers only means growing these two tuples.
+_SCORE_TIERS = (60, 80)
+_SCORE_EMOJIS = ("❌", "⚠️", "✅")
+
+# Grade badge and score colour lookups shared by the results and search
+# renderers, hoisted so per-job rendering doesn't rebuild dict literals
+_GRADE_EMOJI = {
+    "Excellent": "🎉",
+    "Good": "✓",
+    "Fair": "⚠️",
+    "Poor": "❌",
+}
+_SCORE_COLOR_THRESHOLDS = (60, 75)
+_SCORE_COLORS = ("red", "orange", "green")
+
+# Display names for the fixed category set; a dict lookup beats
+# re-running replace + title-case per category on every render
+_CATEGORY_DISPLAY = {
+    c: c.replace('-', ' ').title()
+    for c in (
+        "gender-coded", "ageist", "ableist",
+        "culture-fit", "socioeconomic", "racial",
+    )
+}
+
+
+def _category_display(category: str) -> str:
+    """Return the display name for a category, computing unknown ones."""
+    name = _CATEGORY_DISPLAY.get(category)
+    return name if name is not None else category.replace('-', ' ').title()
+
+
+# Category colours shared by the HighlightedText widgets on the text,
+# file and URL tabs, so the three components can't drift apart
+_HIGHLIGHT_COLOR_MAP = {
+    "gender-coded": "red",
+    "ageist": "orange",
+    "ableist": "purple",
+    "culture-fit": "blue",
+    "socioeconomic": "brown",
+    "racial": "darkred",
+}
+
+
+def _score_color(score: float) -> str:
+    """Map an overall score to its display colour tier."""
+    return _SCORE_COLORS[bisect.bisect_right(_SCORE_COLOR_THRESHOLDS, score)]
+
+
+def _cached_analysis(text: str):
+    """
+    Analyse text, reusing cached results for repeated inputs.
+
+    Args:
+        text: Job ad text to analyse.
+
+    Returns:
+        Tuple of (AnalysisResult, highlighted segments).
+    """
+    key = blake2b(text.encode('utf-8'), digest_size=16).digest()
+    with _analysis_cache_lock:
+        cached = _analysis_cache.get(key)
+        if cached is not None:
+            _analysis_cache.move_to_end(key)
+            return cached
+
+    result = analyse_text(text, get_analyser(), get_config())
+    highlighted = highlight_biased_terms(text, result.matches)
+
+    with _analysis_cache_lock:
+        _analysis_cache[key] = (result, highlighted)
+        if len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+    return result, highlighted
+
+
 def highlight_biased_terms(text: str, matches: list) -> List[Tuple[str, str | None]]:
     """
     Create highlighted text annotations for Gradio.
@@ -51,42 +215,40 @@ def highlight_biased_terms(text: str, matches: list) -> List[Tuple[str, str | No
     """
     if not matches:
         return [(text, None)]
-    
-    # Collect all positions with their labels
+
+    # Collect (start, end, label) tuples; the term length is hoisted out
+    # of the position loop and tuples sort on start without a key function
     highlights = []
     for match in matches:
+        term_len = len(match.term)
+        label = match.category
         for pos in match.positions:
-            highlights.append({
-                'start': pos,
-                'end': pos + len(match.term),
-                'label': f"{match.category}",
-                'severity': match.severity
-            })
-    
-    # Sort by start position
-    highlights.sort(key=lambda x: x['start'])
-    
-    # Build annotated segments
+            highlights.append((pos, pos + term_len, label))
+
+    highlights.sort()
+
+    # Build annotated segments in one sorted sweep
     segments = []
     last_end = 0
-    
-    for hl in highlights:
+
+    for start, end, label in highlights:
+        if start < last_end:
+            # Overlaps a span already highlighted; skip rather than
+            # emitting the overlapping characters twice
+            continue
+
         # Add text before highlight
-        if hl['start'] > last_end:
-            segments.append((text[last_end:hl['start']], None))
-        
+        if start > last_end:
+            segments.append((text[last_end:start], None))
+
         # Add highlighted segment
-        segments.append((
-            text[hl['start']:hl['end']],
-            hl['label']
-        ))
-        
-        last_end = max(last_end, hl['end'])
-    
+        segments.append((text[start:end], label))
+        last_end = end
+
     # Add remaining text
     if last_end < len(text):
         segments.append((text[last_end:], None))
-    
+
     return segments
 
 
@@ -114,10 +276,10 @@ def analyze_job_ad(
         )
     
     # Run analysis
-    result = analyse_text(text, analyser, config)
-    
+    result, highlighted = _cached_analysis(text)
+
     # Format results
-    return format_analysis_results(result, text, show_suggestions)
+    return format_analysis_results(result, text, show_suggestions, highlighted)
 
 
 def analyze_file(
@@ -136,16 +298,28 @@ def analyze_file(
         )
     
     try:
-        # Read file content
-        file_path = Path(file.name)
-        text = file_path.read_text(encoding='utf-8')
+        # Read file content, capped so an oversized upload can't hold
+        # the worker's memory; stray non-UTF-8 bytes are replaced
+        # rather than crashing the analysis
+        with open(file.name, 'rb') as fh:
+            raw = fh.read(_MAX_UPLOAD_BYTES + 1)
+        if len(raw) > _MAX_UPLOAD_BYTES:
+            return (
+                0.0,
+                "Error",
+                "",
+                "Error reading file: file too large (limit 2 MB)",
+                [("", None)],
+                ""
+            )
+        text = raw.decode('utf-8', errors='replace')
         
         # Run analysis
-        result = analyse_text(text, analyser, config)
+        result, highlighted = _cached_analysis(text)
         score, grade, category_md, recommendations_md, highlighted = format_analysis_results(
-            result, text, show_suggestions
+            result, text, show_suggestions, highlighted
         )
-        
+
         return (score, grade, category_md, recommendations_md, highlighted, text)
     
     except Exception as e:
@@ -187,29 +361,41 @@ def analyze_url(
         )
     
     try:
-        # Scrape URL
-        job_data = scraper.scrape(url)
-        
-        if 'error' in job_data:
-            return (
-                0.0,
-                "Error",
-                "",
-                f"❌ Error scraping URL: {job_data['error']}",
-                [("", None)],
-                "",
-                ""
-            )
+        cached = _load_url_cache(url)
+        if cached is not None:
+            job_data = cached['job_data']
+            result = cached['result']
+            highlighted = cached['highlighted']
+        else:
+            # Scrape URL
+            job_data = get_scraper().scrape(url)
+            
+            if 'error' in job_data:
+                return (
+                    0.0,
+                    "Error",
+                    "",
+                    f"❌ Error scraping URL: {job_data['error']}",
+                    [("", None)],
+                    "",
+                    ""
+                )
+            
+            # Run analysis
+            result, highlighted = _cached_analysis(job_data['text'])
+            _store_url_cache(url, {
+                'ts': time.time(),
+                'job_data': job_data,
+                'result': result,
+                'highlighted': highlighted,
+            })
         
         text = job_data['text']
         title = f"{job_data['title']} at {job_data['company']}"
-        
-        # Run analysis
-        result = analyse_text(text, analyser, config)
         score, grade, category_md, recommendations_md, highlighted = format_analysis_results(
-            result, text, show_suggestions
+            result, text, show_suggestions, highlighted
         )
-        
+
         return (score, grade, category_md, recommendations_md, highlighted, text, title)
     
     except Exception as e:
@@ -224,6 +410,61 @@ def analyze_url(
         )
 
 
+def _render_job_card(idx: int, job: dict, result, show_suggestions: bool) -> str:
+    """
+    Render one search-result card as an HTML fragment.
+
+    Scraped fields (title, company, URL) are escaped so markup in a
+    posting can't inject into the results page.
+
+    Args:
+        idx: 1-based position of the card in the results list.
+        job: Scraped job dictionary.
+        result: AnalysisResult for the job's text.
+        show_suggestions: Whether to include the issues/suggestions list.
+
+    Returns:
+        HTML string for the card.
+    """
+    grade_emoji = _GRADE_EMOJI.get(result.grade, "")
+    score_color = _score_color(result.overall_score)
+
+    parts = [f"""
+            <div style="border: 1px solid #ddd; padding: 15px; margin: 10px 0; border-radius: 8px;">
+                <h4>{idx}. {escape(job['title'])} - {escape(job['company'])}</h4>
+                <p><strong>Score:</strong> <span style="color: {score_color}; font-size: 1.2em;">{result.overall_score:.1f}/100</span> 
+                   <strong>Grade:</strong> {result.grade} {grade_emoji}</p>
+                <p><strong>Issues Found:</strong> {len(result.matches)}</p>
+                <p><strong>Source:</strong> <a href="{escape(job['url'])}" target="_blank" rel="noopener">{escape(job['source'])}</a></p>
+                
+                <details>
+                    <summary><strong>Category Breakdown</strong></summary>
+                    <ul>
+            """]
+
+    for category, score in sorted(result.category_scores.items(), key=lambda x: x[1].score):
+        cat_name = _category_display(category)
+        parts.append(f"<li>{cat_name}: {score.score:.1f}/100 ({score.issues_count} issues)</li>")
+
+    parts.append("</ul></details>")
+
+    if show_suggestions and result.matches:
+        parts.append("""
+                <details>
+                    <summary><strong>Issues & Suggestions</strong></summary>
+                    <ul>
+                """)
+        for match in result.matches[:5]:  # Show top 5
+            parts.append(f"""
+                    <li><strong>'{escape(match.term)}'</strong> ({match.category})
+                        <br>→ Suggestion: {escape(match.suggestion)}</li>
+                    """)
+        parts.append("</ul></details>")
+
+    parts.append("</div>")
+    return ''.join(parts)
+
+
 def search_and_analyze(
     query: str,
     source: str,
@@ -247,7 +488,7 @@ def search_and_analyze(
         if location:
             status_msg += f" in {location}"
         
-        jobs = scraper.search_jobs(
+        jobs = get_scraper().search_jobs(
             query=query,
             source=source,
             location=location,
@@ -257,60 +498,20 @@ def search_and_analyze(
         if not jobs:
             return ("❌ No jobs found matching your search.", "")
         
-        # Analyze all jobs
-        results_html = f"<h3>Found {len(jobs)} jobs - Analysis Results</h3><br>"
+        # Analyze all jobs. HTML is accumulated in a list and joined
+        # once; += on a growing string copies the whole buffer per card.
+        html_parts = [f"<h3>Found {len(jobs)} jobs - Analysis Results</h3><br>"]
+        write = html_parts.append
         all_results = []
-        
-        for idx, job in enumerate(jobs, 1):
-            if 'error' in job:
-                continue
-            
-            text = job['text']
-            result = analyse_text(text, analyser, config)
-            
-            # Build result card
-            grade_emoji = {
-                "Excellent": "🎉",
-                "Good": "✓",
-                "Fair": "⚠️",
-                "Poor": "❌"
-            }.get(result.grade, "")
-            
-            score_color = "green" if result.overall_score >= 75 else "orange" if result.overall_score >= 60 else "red"
-            
-            results_html += f"""
-            <div style="border: 1px solid #ddd; padding: 15px; margin: 10px 0; border-radius: 8px;">
-                <h4>{idx}. {job['title']} - {job['company']}</h4>
-                <p><strong>Score:</strong> <span style="color: {score_color}; font-size: 1.2em;">{result.overall_score:.1f}/100</span> 
-                   <strong>Grade:</strong> {result.grade} {grade_emoji}</p>
-                <p><strong>Issues Found:</strong> {len(result.matches)}</p>
-                <p><strong>Source:</strong> <a href="{job['url']}" target="_blank">{job['source']}</a></p>
-                
-                <details>
-                    <summary><strong>Category Breakdown</strong></summary>
-                    <ul>
-            """
-            
-            for category, score in sorted(result.category_scores.items(), key=lambda x: x[1].score):
-                cat_name = category.replace('-', ' ').title()
-                results_html += f"<li>{cat_name}: {score.score:.1f}/100 ({score.issues_count} issues)</li>"
-            
-            results_html += "</ul></details>"
-            
-            if show_suggestions and result.matches:
-                results_html += """
-                <details>
-                    <summary><strong>Issues & Suggestions</strong></summary>
-                    <ul>
-                """
-                for match in result.matches[:5]:  # Show top 5
-                    results_html += f"""
-                    <li><strong>'{match.term}'</strong> ({match.category})
-                        <br>→ Suggestion: {match.suggestion}</li>
-                    """
-                results_html += "</ul></details>"
-            
-            results_html += "</div>"
+
+        # Analyse every successfully scraped job in one batched pass
+        valid_jobs = [job for job in jobs if 'error' not in job]
+        results = analyse_texts(
+            [job['text'] for job in valid_jobs], get_analyser(), get_config()
+        )
+
+        for idx, (job, result) in enumerate(zip(valid_jobs, results), 1):
+            write(_render_job_card(idx, job, result, show_suggestions))
             
             all_results.append({
                 'title': job['title'],
@@ -321,12 +522,18 @@ def search_and_analyze(
                 'issues': len(result.matches)
             })
         
-        # Create downloadable CSV
-        csv_data = "Title,Company,URL,Score,Grade,Issues\n"
+        # Create downloadable CSV through csv.writer so quotes inside
+        # titles or company names are escaped correctly
+        csv_buf = io.StringIO()
+        writer = csv.writer(csv_buf)
+        writer.writerow(['Title', 'Company', 'URL', 'Score', 'Grade', 'Issues'])
         for r in all_results:
-            csv_data += f'"{r["title"]}","{r["company"]}","{r["url"]}",{r["score"]},{r["grade"]},{r["issues"]}\n'
+            writer.writerow([
+                r['title'], r['company'], r['url'],
+                r['score'], r['grade'], r['issues'],
+            ])
         
-        return (results_html, csv_data)
+        return (''.join(html_parts), csv_buf.getvalue())
     
     except Exception as e:
         return (f"❌ Error searching jobs: {str(e)}", "")
@@ -335,74 +542,72 @@ def search_and_analyze(
 def format_analysis_results(
     result,
     text: str,
-    show_suggestions: bool
+    show_suggestions: bool,
+    highlighted: Optional[List[Tuple[str, str | None]]] = None
 ) -> Tuple[float, str, str, str, List[Tuple[str, str | None]]]:
     """Format analysis results for display."""
-    # Format category breakdown
-    category_md = "### Category Scores\n\n"
+    # Format category breakdown. Markdown is accumulated in lists and
+    # joined once so large results don't pay quadratic string appends.
+    category_parts = ["### Category Scores\n\n"]
     if result.category_scores:
         for category, score in sorted(
             result.category_scores.items(),
             key=lambda x: x[1].score
         ):
-            cat_name = category.replace('-', ' ').title()
+            cat_name = _category_display(category)
             score_val = score.score
-            
-            # Emoji based on score
-            if score_val >= 80:
-                emoji = "✅"
-            elif score_val >= 60:
-                emoji = "⚠️"
-            else:
-                emoji = "❌"
-            
-            category_md += (
+            emoji = _SCORE_EMOJIS[bisect.bisect_right(_SCORE_TIERS, score_val)]
+
+            category_parts.append(
                 f"**{cat_name}:** {score_val:.1f}/100 {emoji} "
                 f"({score.issues_count} issue(s))\n\n"
             )
     else:
-        category_md += "No issues detected! 🎉\n\n"
-    
+        category_parts.append("No issues detected! 🎉\n\n")
+    category_md = ''.join(category_parts)
+
     # Format recommendations
-    recommendations_md = "### Recommendations\n\n"
+    rec_parts = ["### Recommendations\n\n"]
     for rec in result.recommendations:
-        recommendations_md += f"- {rec}\n"
-    
+        rec_parts.append(f"- {rec}\n")
+
     if result.positive_aspects:
-        recommendations_md += "\n### Positive Aspects ✨\n\n"
+        rec_parts.append("\n### Positive Aspects ✨\n\n")
         for aspect in result.positive_aspects:
-            recommendations_md += f"- ✓ Contains '{aspect}'\n"
-    
+            rec_parts.append(f"- ✓ Contains '{aspect}'\n")
+
     # Format issues with suggestions
-    issues_md = ""
     if result.matches and show_suggestions:
-        issues_md = "\n\n### Detailed Issues\n\n"
-        
-        severity_order = ['critical', 'high', 'medium', 'low']
-        for severity in severity_order:
-            sev_matches = [m for m in result.matches if m.severity == severity]
+        rec_parts.append("\n\n### Detailed Issues\n\n")
+
+        # Bucket matches by severity in one pass instead of filtering
+        # the list once per level
+        buckets: Dict[str, list] = {}
+        for m in result.matches:
+            buckets.setdefault(m.severity, []).append(m)
+
+        for severity in _SEVERITY_ORDER:
+            sev_matches = buckets.get(severity)
             if not sev_matches:
                 continue
-            
-            issues_md += f"#### {severity.upper()} Severity\n\n"
-            
+
+            rec_parts.append(_SEV_HEADERS[severity])
+
             for match in sev_matches:
-                issues_md += f"**'{match.term}'** ({match.category}) - found {match.count}x\n"
-                issues_md += f"- **Issue:** {match.explanation}\n"
-                issues_md += f"- **Suggestion:** {match.suggestion}\n\n"
-    
-    recommendations_md += issues_md
+                rec_parts.append(
+                    f"**'{match.term}'** ({match.category}) - found {match.count}x\n"
+                    f"- **Issue:** {match.explanation}\n"
+                    f"- **Suggestion:** {match.suggestion}\n\n"
+                )
+
+    recommendations_md = ''.join(rec_parts)
     
-    # Create highlighted text
-    highlighted = highlight_biased_terms(text, result.matches)
+    # Create highlighted text (reused from the cache when available)
+    if highlighted is None:
+        highlighted = highlight_biased_terms(text, result.matches)
     
     # Grade with emoji
-    grade_emoji = {
-        "Excellent": "🎉",
-        "Good": "✓",
-        "Fair": "⚠️",
-        "Poor": "❌"
-    }.get(result.grade, "")
+    grade_emoji = _GRADE_EMOJI.get(result.grade, "")
     
     grade_display = f"{result.grade} {grade_emoji}"
     
@@ -415,13 +620,61 @@ def format_analysis_results(
     )
 
 
-def create_interface() -> gr.Blocks:
-    """Create and configure the Gradio interface."""
-    
-    # Load examples
-    examples = [
-        [
-            """Senior Software Engineer
+# Path of the most recent search CSV. Each search writes a fresh temp
+# file — concurrent searches must never share one mutable path, or a
+# download link can serve another search's data — and the previous file
+# is unlinked on replacement so /tmp doesn't accumulate one file per
+# search for the life of the server.
+_search_csv_path: Optional[str] = None
+_search_csv_lock = threading.Lock()
+
+
+def _write_search_csv(csv_data: str) -> str:
+    """Write the search CSV to a fresh temp file and return its path."""
+    global _search_csv_path
+    fd, path = tempfile.mkstemp(prefix='ijaa-search-', suffix='.csv')
+    with os.fdopen(fd, 'wb') as fh:
+        fh.write(csv_data.encode('utf-8'))
+
+    with _search_csv_lock:
+        previous, _search_csv_path = _search_csv_path, path
+    if previous is not None:
+        try:
+            os.unlink(previous)
+        except OSError:
+            pass
+    return path
+
+
+def _cleanup_search_csv() -> None:
+    """Remove the latest search CSV temp file at interpreter exit."""
+    if _search_csv_path is not None:
+        try:
+            os.unlink(_search_csv_path)
+        except OSError:
+            pass
+
+
+atexit.register(_cleanup_search_csv)
+
+
+def _import_gradio():
+    """Import and return gradio, deferred so CLI/test imports stay fast."""
+    try:
+        import gradio as gr
+    except ImportError:
+        raise ImportError(
+            "The web interface requires Gradio. "
+            "Install it with: pip install gradio"
+        )
+    return gr
+
+
+# Example inputs for the text tab, constant so rebuilding the interface
+# (tests, hot reload) reuses the same objects
+_EXAMPLES = [
+    [
+        """Senior Software Engineer
 
 We're looking for a rockstar developer to join our young and energetic team! 
 Must be a digital native who can work in a fast-paced environment.
@@ -435,10 +688,10 @@ Requirements:
 
 We need someone who's crazy good at coding and can crush it under pressure.
 """,
-            True
-        ],
-        [
-            """Senior Software Engineer
+        True
+    ],
+    [
+        """Senior Software Engineer
 
 We're seeking a skilled professional to join our collaborative team.
 
@@ -455,9 +708,14 @@ We offer:
 - Accommodations available
 - All backgrounds welcome
 """,
-            True
-        ]
+        True
     ]
+]
+
+
+def create_interface() -> gr.Blocks:
+    """Create and configure the Gradio interface."""
+    gr = _import_gradio()
     
     with gr.Blocks(
         title="Inclusive Job Ad Analyzer",
@@ -502,7 +760,7 @@ We offer:
                         
                         gr.Markdown("### 📝 Try Examples")
                         gr.Examples(
-                            examples=examples,
+                            examples=_EXAMPLES,
                             inputs=[text_input, text_show_suggestions],
                             label="Load Example"
                         )
@@ -517,21 +775,16 @@ We offer:
                     label="Analyzed Text (biased terms highlighted)",
                     combine_adjacent=True,
                     show_legend=True,
-                    color_map={
-                        "gender-coded": "red",
-                        "ageist": "orange",
-                        "ableist": "purple",
-                        "culture-fit": "blue",
-                        "socioeconomic": "brown",
-                        "racial": "darkred",
-                    },
+                    color_map=_HIGHLIGHT_COLOR_MAP,
                     elem_classes="output-section"
                 )
                 
                 text_analyze_btn.click(
                     fn=analyze_job_ad,
                     inputs=[text_input, text_show_suggestions],
-                    outputs=[text_score, text_grade, text_categories, text_recommendations, text_highlighted]
+                    outputs=[text_score, text_grade, text_categories, text_recommendations, text_highlighted],
+                    trigger_mode="always_last",
+                    concurrency_id="analyze"
                 )
             
             # Tab 2: File Upload
@@ -569,21 +822,16 @@ We offer:
                     label="Analyzed Text",
                     combine_adjacent=True,
                     show_legend=True,
-                    color_map={
-                        "gender-coded": "red",
-                        "ageist": "orange",
-                        "ableist": "purple",
-                        "culture-fit": "blue",
-                        "socioeconomic": "brown",
-                        "racial": "darkred",
-                    },
+                    color_map=_HIGHLIGHT_COLOR_MAP,
                     elem_classes="output-section"
                 )
                 
                 file_analyze_btn.click(
                     fn=analyze_file,
                     inputs=[file_input, file_show_suggestions],
-                    outputs=[file_score, file_grade, file_categories, file_recommendations, file_highlighted, file_text_display]
+                    outputs=[file_score, file_grade, file_categories, file_recommendations, file_highlighted, file_text_display],
+                    trigger_mode="always_last",
+                    concurrency_id="analyze"
                 )
             
             # Tab 3: URL Scraper
@@ -637,21 +885,16 @@ We offer:
                     label="Analyzed Text",
                     combine_adjacent=True,
                     show_legend=True,
-                    color_map={
-                        "gender-coded": "red",
-                        "ageist": "orange",
-                        "ableist": "purple",
-                        "culture-fit": "blue",
-                        "socioeconomic": "brown",
-                        "racial": "darkred",
-                    },
+                    color_map=_HIGHLIGHT_COLOR_MAP,
                     elem_classes="output-section"
                 )
                 
                 url_analyze_btn.click(
                     fn=analyze_url,
                     inputs=[url_input, url_show_suggestions],
-                    outputs=[url_score, url_grade, url_categories, url_recommendations, url_highlighted, url_text_display, url_job_title]
+                    outputs=[url_score, url_grade, url_categories, url_recommendations, url_highlighted, url_text_display, url_job_title],
+                    trigger_mode="always_last",
+                    concurrency_id="analyze"
                 )
             
             # Tab 4: Job Board Search
@@ -715,11 +958,7 @@ We offer:
                     html_results, csv_data = search_and_analyze(query, source, location, max_results, show_suggestions)
                     
                     if csv_data:
-                        # Save CSV to temp file
-                        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-                            f.write(csv_data)
-                            csv_path = f.name
-                        return html_results, csv_path
+                        return html_results, _write_search_csv(csv_data)
                     
                     return html_results, None
                 
@@ -755,12 +994,24 @@ We offer:
 
 def main():
     """Launch the Gradio web interface."""
-    interface = create_interface()
-    
+    try:
+        interface = create_interface()
+    except ImportError:
+        print("Error: Gradio is not installed.", file=sys.stderr)
+        print("Install it with: pip install gradio", file=sys.stderr)
+        sys.exit(1)
+
+
     print("\n" + "="*60)
     print("Starting Inclusive Job Ad Analyzer Web Interface")
     print("="*60 + "\n")
     
+    # Bound concurrent analyses to the CPU count and drop superseded
+    # requests instead of queueing every repeated click
+    interface.queue(
+        default_concurrency_limit=os.cpu_count() or 4,
+        max_size=32,
+    )
     interface.launch(
         server_name="127.0.0.1",
         server_port=7860,
@@ -5,8 +5,23 @@ Shared test fixtures and configuration.
 import pytest
 from pathlib import Path
 
+from inclusive_job_ad_analyser.analyser import JobAdAnalyser
+from inclusive_job_ad_analyser.loaders import ConfigLoader
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
+def analyser():
+    """Shared analyser; read-only in tests, so one build serves the run."""
+    return JobAdAnalyser(use_spacy=False)  # Use regex only for consistent tests
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Shared configuration loader."""
+    return ConfigLoader()
+
+
+@pytest.fixture(scope="session")
 def sample_biased_text():
     """Sample job ad with multiple biased terms."""
     return """
@@ -27,7 +42,7 @@ We need someone who's crazy good at coding and can crush it under pressure.
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_neutral_text():
     """Sample job ad with inclusive language."""
     return """
@@ -51,17 +66,17 @@ We offer:
 """
 
 
-@pytest.fixture
-def temp_job_ad_file(tmp_path, sample_biased_text):
+@pytest.fixture(scope="module")
+def temp_job_ad_file(tmp_path_factory, sample_biased_text):
     """Create a temporary file with a job ad."""
-    file_path = tmp_path / "job_ad.txt"
+    file_path = tmp_path_factory.mktemp("ads") / "job_ad.txt"
     file_path.write_text(sample_biased_text)
     return file_path
 
 
-@pytest.fixture
-def temp_neutral_file(tmp_path, sample_neutral_text):
+@pytest.fixture(scope="module")
+def temp_neutral_file(tmp_path_factory, sample_neutral_text):
     """Create a temporary file with a neutral job ad."""
-    file_path = tmp_path / "neutral_ad.txt"
+    file_path = tmp_path_factory.mktemp("ads") / "neutral_ad.txt"
     file_path.write_text(sample_neutral_text)
     return file_path
@@ -9,12 +9,6 @@ from inclusive_job_ad_analyser.analyser import JobAdAnalyser
 from inclusive_job_ad_analyser.models import MatchResult
 
 
-@pytest.fixture
-def analyser():
-    """Create analyser instance for testing."""
-    return JobAdAnalyser(use_spacy=False)  # Use regex only for consistent tests
-
-
 class TestJobAdAnalyser:
     """Tests for JobAdAnalyser class."""
     
@@ -10,18 +10,6 @@ from inclusive_job_ad_analyser.cli import analyse_text
 from inclusive_job_ad_analyser.loaders import ConfigLoader
 
 
-@pytest.fixture
-def analyser():
-    """Create analyser for integration tests."""
-    return JobAdAnalyser(use_spacy=False)
-
-
-@pytest.fixture
-def config():
-    """Load configuration for tests."""
-    return ConfigLoader()
-
-
 class TestFullPipeline:
     """Integration tests for complete analysis pipeline."""
     
@@ -12,6 +12,17 @@ except ImportError:
     _HAS_SCRAPING = False
 
 
+def _html_response(html: str) -> Mock:
+    """Build a mock HTTP response carrying the given HTML, streamable."""
+    body = html.encode('utf-8')
+    response = Mock()
+    response.content = body
+    response.headers = {'Content-Type': 'text/html; charset=utf-8'}
+    response.iter_content = Mock(side_effect=lambda *a, **k: iter([body]))
+    response.raise_for_status = Mock()
+    return response
+
+
 @pytest.mark.skipif(not _HAS_SCRAPING, reason="Scraping dependencies not installed")
 class TestJobAdScraper:
     """Tests for JobAdScraper class."""
@@ -58,12 +69,8 @@ class TestJobAdScraper:
     @patch('inclusive_job_ad_analyser.scraper.requests.Session.get')
     def test_scrape_linkedin(self, mock_get, scraper, mock_linkedin_html):
         """Test scraping LinkedIn job ad."""
-        # Mock response
-        mock_response = Mock()
-        mock_response.text = mock_linkedin_html
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
-        
+        mock_get.return_value = _html_response(mock_linkedin_html)
+
         url = "https://www.linkedin.com/jobs/view/123456"
         result = scraper.scrape(url)
         
@@ -76,12 +83,8 @@ class TestJobAdScraper:
     @patch('inclusive_job_ad_analyser.scraper.requests.Session.get')
     def test_scrape_indeed(self, mock_get, scraper, mock_indeed_html):
         """Test scraping Indeed job ad."""
-        # Mock response
-        mock_response = Mock()
-        mock_response.text = mock_indeed_html
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
-        
+        mock_get.return_value = _html_response(mock_indeed_html)
+
         url = "https://www.indeed.com/viewjob?jk=abc123"
         result = scraper.scrape(url)
         
@@ -104,11 +107,8 @@ class TestJobAdScraper:
             </body>
         </html>
         """
-        mock_response = Mock()
-        mock_response.text = html
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
-        
+        mock_get.return_value = _html_response(html)
+
         url = "https://example.com/careers/product-manager"
         result = scraper.scrape(url)
         
@@ -128,11 +128,8 @@ class TestJobAdScraper:
     @patch('inclusive_job_ad_analyser.scraper.requests.Session.get')
     def test_scrape_multiple(self, mock_get, scraper, mock_linkedin_html):
         """Test scraping multiple URLs."""
-        mock_response = Mock()
-        mock_response.text = mock_linkedin_html
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
-        
+        mock_get.return_value = _html_response(mock_linkedin_html)
+
         urls = [
             "https://www.linkedin.com/jobs/view/123",
             "https://www.linkedin.com/jobs/view/456"
@@ -177,16 +174,12 @@ class TestJobAdScraper:
         """
         
         def mock_response(*args, **kwargs):
-            response = Mock()
             if 'viewjob' in str(args):
-                response.text = job_html
-            else:
-                response.text = search_html
-            response.raise_for_status = Mock()
-            return response
-        
+                return _html_response(job_html)
+            return _html_response(search_html)
+
         mock_get.side_effect = mock_response
-        
+
         results = scraper.search_jobs("software engineer", source="indeed", max_results=2)
         
         assert len(results) <= 2
@@ -216,20 +209,51 @@ class TestJobAdScraper:
         """
         
         def mock_response(*args, **kwargs):
-            response = Mock()
             if '/jobs/view/' in str(args):
-                response.text = job_html
-            else:
-                response.text = search_html
-            response.raise_for_status = Mock()
-            return response
-        
+                return _html_response(job_html)
+            return _html_response(search_html)
+
         mock_get.side_effect = mock_response
-        
+
         results = scraper.search_jobs("product manager", source="linkedin", max_results=5)
         
         assert isinstance(results, list)
     
+    @patch('inclusive_job_ad_analyser.scraper.requests.Session.get')
+    def test_search_repeated_returns_same_results(self, mock_get, scraper):
+        """Test that repeating an identical search returns results both times."""
+        search_html = """
+        <html>
+            <div class="job_seen_beacon">
+                <a class="jcs-JobTitle" data-jk="job123">Software Engineer</a>
+            </div>
+        </html>
+        """
+
+        job_html = """
+        <html>
+            <h1 class="jobsearch-JobInfoHeader-title">Software Engineer</h1>
+            <div data-company-name="true">Tech Corp</div>
+            <div id="jobDescriptionText">
+                <p>We are looking for a talented software engineer</p>
+            </div>
+        </html>
+        """
+
+        def mock_response(*args, **kwargs):
+            if 'viewjob' in str(args):
+                return _html_response(job_html)
+            return _html_response(search_html)
+
+        mock_get.side_effect = mock_response
+
+        first = scraper.search_jobs("software engineer", source="indeed", max_results=2)
+        second = scraper.search_jobs("software engineer", source="indeed", max_results=2)
+
+        # Dedupe state must not leak between searches
+        assert len(first) == 1
+        assert len(second) == len(first)
+
     def test_search_invalid_source(self, scraper):
         """Test that invalid source raises error."""
         with pytest.raises(ValueError, match="Unsupported job board"):